@@ -163,13 +163,14 @@ def run_gui():
         from PyQt6.QtWidgets import QApplication
         
         print("[INFO] Loading GUI modules...")
-        from src.gui.main_window import MainWindow
+        from src.gui.main_window import MainWindow, apply_app_stylesheet
         
         print("[INFO] Creating application...")
         app = QApplication(sys.argv)
         app.setApplicationName("Asset Harvester")
         app.setApplicationVersion("1.0.0")
         app.setOrganizationName("AssetHarvester")
+        apply_app_stylesheet(app)
         
         print("[INFO] Creating main window...")
         window = MainWindow()
@@ -105,13 +105,14 @@ class AssetComparator:
         session = self.db.Session()
         try:
             from .database import VanillaFile
-            vanilla_files = session.query(VanillaFile).filter(
+            # Only the two columns needed: plain rows, no ORM object per file
+            rows = session.query(VanillaFile.path, VanillaFile.hash_md5).filter(
                 VanillaFile.game_id == self.game_id
-            ).all()
+            )
             
             self.baseline_cache = {
-                vf.path.lower(): vf.hash_md5 
-                for vf in vanilla_files
+                path.lower(): hash_md5
+                for path, hash_md5 in rows
             }
             
             print(f"[INFO] Loaded {len(self.baseline_cache)} vanilla files into cache")
@@ -134,7 +135,8 @@ class AssetComparator:
         hashes in parallel, and stores them in the database. This only needs
         to be done once per game (unless the vanilla version changes).
 
-        Performance: Uses parallel hashing and batch database inserts.
+        Performance: Uses parallel hashing and batch database inserts, all in
+        one transaction (a single commit for the whole baseline).
 
         Args:
             vanilla_path:      Path to the vanilla/original game client folder
@@ -176,50 +178,72 @@ class AssetComparator:
         total_files = len(all_files)
         print(f"[INFO] Found {total_files} files to process")
 
-        # Process files in batches with parallel hashing
+        # Process files in batches with parallel hashing. Batches are inserted
+        # through one session and committed once, instead of one commit each.
         added_count = 0
         processed = 0
+        session = self.db.Session()
 
-        for batch_start in range(0, total_files, batch_size):
-            batch_end = min(batch_start + batch_size, total_files)
-            batch = all_files[batch_start:batch_end]
-
-            # Hash files in parallel
-            file_paths = [fp for fp, _ in batch]
-            hashes = self.hasher.hash_files_parallel(file_paths)
-
-            # Prepare batch insert data
-            batch_data = []
-            for full_path, rel_path in batch:
-                try:
-                    md5_hash = hashes.get(full_path)
-                    if md5_hash:
-                        file_size = os.path.getsize(full_path)
-                        batch_data.append({
-                            'game_id': self.game_id,
-                            'path': rel_path,
-                            'hash_md5': md5_hash,
-                            'size': file_size
-                        })
-                        self.baseline_cache[rel_path.lower()] = md5_hash
-                        added_count += 1
-                except Exception as e:
-                    print(f"[WARN] Failed to process {rel_path}: {e}")
-
-            # Batch insert to database
-            if batch_data:
-                self._batch_insert_vanilla_files(batch_data)
-
-            processed += len(batch)
-            if progress_callback:
-                progress_callback(processed, total_files, f"Processed {processed}/{total_files}")
+        try:
+            for batch_start in range(0, total_files, batch_size):
+                batch_end = min(batch_start + batch_size, total_files)
+                batch = all_files[batch_start:batch_end]
+
+                # Hash files in parallel
+                file_paths = [fp for fp, _ in batch]
+                hashes = self.hasher.hash_files_parallel(file_paths)
+
+                # Prepare batch insert data
+                batch_data = []
+                for full_path, rel_path in batch:
+                    try:
+                        md5_hash = hashes.get(full_path)
+                        if md5_hash:
+                            file_size = os.path.getsize(full_path)
+                            batch_data.append({
+                                'game_id': self.game_id,
+                                'path': rel_path,
+                                'hash_md5': md5_hash,
+                                'size': file_size
+                            })
+                            self.baseline_cache[rel_path.lower()] = md5_hash
+                            added_count += 1
+                    except Exception as e:
+                        print(f"[WARN] Failed to process {rel_path}: {e}")
+
+                # Batch insert to database
+                if batch_data:
+                    self._batch_insert_vanilla_files(batch_data, session)
+
+                processed += len(batch)
+                if progress_callback:
+                    progress_callback(processed, total_files, f"Processed {processed}/{total_files}")
+
+            session.commit()
+        except Exception as e:
+            # Nothing from this run was stored: drop its rows from the cache too
+            session.rollback()
+            print(f"[ERROR] Baseline insert failed: {e}")
+            self._load_baseline_cache()
+            return 0
+        finally:
+            session.close()
 
         print(f"[INFO] Added {added_count} files to baseline")
         return added_count
 
-    def _batch_insert_vanilla_files(self, files_data: List[Dict]):
-        """Batch insert vanilla files into database."""
+    def _batch_insert_vanilla_files(self, files_data: List[Dict], session=None):
+        """
+        Batch insert vanilla files into database.
+
+        With `session`, the rows join that session's open transaction and the
+        caller commits; otherwise they are committed on their own.
+        """
         from .database import VanillaFile
+        if session is not None:
+            session.bulk_insert_mappings(VanillaFile, files_data)
+            return
+
         session = self.db.Session()
         try:
             session.bulk_insert_mappings(VanillaFile, files_data)
@@ -94,6 +94,10 @@ DEFAULT_CONFIG = {
     # Theme (dark, light)
     "theme": "dark",
     
+    # Last directory used by each browse dialog ({dialog key: directory}),
+    # so dialogs reopen where the user left off
+    "recent_dirs": {},
+    
     # -------------------------------------------------------------------------
     # ADVANCED
     # -------------------------------------------------------------------------
@@ -145,8 +149,10 @@ class Config:
             )
             self.config_path = os.path.join(project_root, 'data', 'config.json')
         
-        # Initialize with defaults
-        self.data: Dict[str, Any] = DEFAULT_CONFIG.copy()
+        # Initialize with defaults (copied one level deep so dict-valued
+        # defaults such as recent_dirs are not shared between instances)
+        self.data: Dict[str, Any] = {k: (v.copy() if isinstance(v, dict) else v)
+                                     for k, v in DEFAULT_CONFIG.items()}
         
         # Track if config has been modified
         self._modified = False
@@ -216,7 +222,8 @@ class Config:
     
     def reset_to_defaults(self):
         """Reset all settings to their default values."""
-        self.data = DEFAULT_CONFIG.copy()
+        self.data = {k: (v.copy() if isinstance(v, dict) else v)
+                     for k, v in DEFAULT_CONFIG.items()}
         self._modified = True
     
     # -------------------------------------------------------------------------
@@ -16,7 +16,7 @@
 import os
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float
+from sqlalchemy import create_engine, event, Column, Integer, String, DateTime, Boolean, ForeignKey, Text, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 
@@ -317,6 +317,19 @@ class Database:
         Session: SQLAlchemy session factory
     """
     
+    # Applied to every new SQLite connection. WAL lets readers (GUI, Character
+    # Designer) proceed while a worker writes; synchronous=NORMAL is safe under
+    # WAL and roughly halves fsyncs on bulk inserts; busy_timeout makes a
+    # connection wait for a lock instead of failing with "database is locked".
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",   # 256 MB
+        "PRAGMA cache_size=-65536",     # 64 MB (negative = KiB)
+        "PRAGMA busy_timeout=5000",     # ms
+    )
+    
     def __init__(self, db_path: str):
         """
         Initialize the database connection.
@@ -334,6 +347,7 @@ class Database:
         # Create the SQLAlchemy engine
         # The 'sqlite:///' prefix tells SQLAlchemy to use SQLite
         self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        event.listen(self.engine, 'connect', self._set_sqlite_pragmas)
         
         # Create a session factory
         # Sessions are used for all database operations
@@ -345,6 +359,16 @@ class Database:
         # Insert default data (asset types, initial games)
         self._seed_defaults()
     
+    @classmethod
+    def _set_sqlite_pragmas(cls, dbapi_connection, connection_record):
+        """Configure each raw SQLite connection as the pool opens it."""
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in cls.SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+    
     def _create_tables(self):
         """Create all database tables if they don't exist."""
         Base.metadata.create_all(self.engine)
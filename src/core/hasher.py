@@ -128,13 +128,13 @@ class FileHasher:
 
             with open(file_path, 'rb') as f:
                 with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    # Process in chunks to avoid memory issues with huge files
-                    file_size = mm.size()
-                    offset = 0
-                    while offset < file_size:
-                        chunk_end = min(offset + self.chunk_size * 4, file_size)
-                        hash_obj.update(mm[offset:chunk_end])
-                        offset = chunk_end
+                    # Hint sequential access so the kernel reads ahead aggressively
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    # Hash the mapping in place: one update() over a memoryview,
+                    # no per-chunk bytes copies (hashlib releases the GIL meanwhile)
+                    with memoryview(mm) as mv:
+                        hash_obj.update(mv)
 
             return hash_obj.hexdigest()
 
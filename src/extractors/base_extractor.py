@@ -23,6 +23,9 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Callable, Iterator
 from dataclasses import dataclass
 
+# Default piece size for open_file_stream (small enough to stay cache-resident)
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 # ==============================================================================
 # FILE ENTRY DATA CLASS
@@ -72,8 +75,15 @@ class BaseExtractor(ABC):
         with GRFExtractor("data.grf") as ext:
             files = ext.list_files()
             ext.extract_all("output/")
+    
+    Callers that extract many files and create the output directories
+    themselves can set create_output_dirs = False so extract_file skips its
+    own os.makedirs call per file.
     """
     
+    # Whether extract_file creates the output file's parent directory
+    create_output_dirs = True
+    
     def __init__(self, archive_path: str = None):
         """
         Initialize the extractor.
@@ -214,6 +224,26 @@ class BaseExtractor(ABC):
     # COMMON METHODS - Can be overridden but have default implementations
     # ==========================================================================
     
+    def open_file_stream(self, file_path: str,
+                         chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield a file's contents in pieces of at most `chunk_size` bytes.
+        
+        The default slices get_file_data(); extractors that can read a file
+        incrementally should override this so large files are never held whole.
+        Yields nothing if the file is not found.
+        
+        Args:
+            file_path: Path of the file within the archive
+            chunk_size: Maximum bytes per yielded piece
+        """
+        data = self.get_file_data(file_path)
+        if not data:
+            return
+        view = memoryview(data)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+    
     def extract_all(self, output_dir: str,
                     progress_callback: Callable[[int, int, str], None] = None,
                     file_filter: Callable[[FileEntry], bool] = None) -> int:
@@ -42,7 +42,7 @@ import os
 import struct
 import zlib
 import time
-from typing import List, Optional, Dict, Tuple
+from typing import List, Optional, Dict, Tuple, Iterator
 from dataclasses import dataclass
 import concurrent.futures
 import fnmatch
@@ -68,6 +68,9 @@ GRF_FILE_FLAG_FILE = 0x01       # Entry is a file (not directory)
 GRF_FILE_FLAG_MIXCRYPT = 0x02  # Uses mixed encryption (not implemented)
 GRF_FILE_FLAG_DES = 0x04       # Uses DES encryption (not implemented)
 
+# Files per batch yielded by GRFEditor.add_directory_iter
+ADD_DIRECTORY_BATCH = 512
+
 
 # ==============================================================================
 # DATA CLASSES
@@ -138,6 +141,8 @@ class GRFEditor:
         self.files: Dict[str, GRFFileEntry] = {}
         self.modified: bool = False
         self.version: int = GRF_VERSION_200
+        # Sorted display paths for sorted_files(); None when the set of paths changed
+        self._sorted_paths: Optional[List[str]] = None
 
     # ==========================================================================
     # PUBLIC API
@@ -158,6 +163,7 @@ class GRFEditor:
         """
         self.grf_path = grf_path
         self.files = {}
+        self._sorted_paths = None
         self.modified = True
         self.version = GRF_VERSION_200
 
@@ -193,6 +199,7 @@ class GRFEditor:
 
         self.grf_path = grf_path
         self.files = {}
+        self._sorted_paths = None
         self.version = extractor.version
 
         # Load file entries (but NOT the actual data - too memory intensive)
@@ -310,11 +317,62 @@ class GRFEditor:
         )
 
         self.modified = True
+        self._sorted_paths = None
 
         size_kb = len(data) / 1024
         print(f"[INFO] Added {grf_path_normalized} ({size_kb:.1f} KB)")
         return True
 
+    def add_directory_iter(self, local_dir: str, grf_dir: str, recursive: bool = True,
+                           batch_size: int = ADD_DIRECTORY_BATCH
+                           ) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Walk local_dir and yield (local_path, grf_path) pairs in batches.
+
+        Nothing is added here - the caller adds each pair with add_file(), so it
+        can report progress (or stop) once per batch. Uses os.scandir, which
+        streams entries and reuses their cached type info instead of building
+        and stat-ing full listings like os.walk does.
+
+        Args:
+            local_dir: Local directory path (e.g., "C:\\custom_data")
+            grf_dir: Target directory in GRF (e.g., "data\\sprite")
+            recursive: Whether to include subdirectories
+            batch_size: Maximum number of pairs per yielded batch
+
+        Yields:
+            Lists of (local_path, grf_path) tuples
+        """
+        grf_dir_normalized = grf_dir.replace('/', '\\').rstrip('\\')
+
+        batch = []
+        # Depth-first, one open directory handle at a time
+        pending = [(local_dir, grf_dir_normalized)]
+        while pending:
+            local_root, grf_root = pending.pop()
+            subdirs = []
+            try:
+                with os.scandir(local_root) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file():
+                                batch.append((entry.path, f"{grf_root}\\{entry.name}"))
+                                if len(batch) >= batch_size:
+                                    yield batch
+                                    batch = []
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                subdirs.append((entry.path, f"{grf_root}\\{entry.name}"))
+                        except OSError as e:
+                            print(f"[WARN] Skipping {entry.path}: {e}")
+            except OSError as e:
+                print(f"[WARN] Cannot read directory {local_root}: {e}")
+                continue
+            # Reverse so subdirectories are visited in listing order
+            pending.extend(reversed(subdirs))
+
+        if batch:
+            yield batch
+
     def add_directory(self, local_dir: str, grf_dir: str,
                      recursive: bool = True, compress: bool = True) -> int:
         """
@@ -344,27 +402,8 @@ class GRFEditor:
 
         print(f"[INFO] Adding directory {local_dir} -> {grf_dir_normalized}")
 
-        # Walk directory tree
-        for root, dirs, files in os.walk(local_dir):
-            # Calculate relative path
-            rel_root = os.path.relpath(root, local_dir)
-
-            # Skip subdirectories if not recursive
-            if not recursive and rel_root != '.':
-                break
-
-            # Process each file
-            for filename in files:
-                local_file_path = os.path.join(root, filename)
-
-                # Build GRF path
-                if rel_root == '.':
-                    grf_file_path = f"{grf_dir_normalized}\\{filename}"
-                else:
-                    rel_path = rel_root.replace('/', '\\')
-                    grf_file_path = f"{grf_dir_normalized}\\{rel_path}\\{filename}"
-
-                # Add the file
+        for batch in self.add_directory_iter(local_dir, grf_dir, recursive):
+            for local_file_path, grf_file_path in batch:
                 if self.add_file(local_file_path, grf_file_path, compress):
                     count += 1
 
@@ -386,6 +425,7 @@ class GRFEditor:
         if grf_path_lower in self.files:
             del self.files[grf_path_lower]
             self.modified = True
+            self._sorted_paths = None
             print(f"[INFO] Removed {grf_path}")
             return True
         else:
@@ -401,6 +441,21 @@ class GRFEditor:
         """
         return [entry.path for entry in self.files.values()]
 
+    def sorted_files(self) -> List[str]:
+        """
+        Get all GRF paths, sorted.
+
+        The sorted list is cached until files are added, removed or renamed,
+        so refreshing a view without changes costs nothing. Treat the returned
+        list as read-only.
+
+        Returns:
+            Sorted list of GRF paths
+        """
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(entry.path for entry in self.files.values())
+        return self._sorted_paths
+
     def search(self, query: str, use_regex: bool = False) -> List[str]:
         """
         Search for files in the GRF.
@@ -469,6 +524,7 @@ class GRFEditor:
         self.files[new_path_lower] = entry
         
         self.modified = True
+        self._sorted_paths = None
         print(f"[INFO] Renamed: {old_path} -> {new_path_normalized}")
         return True
 
@@ -530,6 +586,7 @@ class GRFEditor:
         
         if count > 0:
             self.modified = True
+            self._sorted_paths = None
             
         print(f"[SUCCESS] Merged {count} files ({skipped} skipped)")
         return count
@@ -588,6 +645,7 @@ class GRFEditor:
 
         self.grf_path = None
         self.files = {}
+        self._sorted_paths = None
         self.modified = False
 
     # ==========================================================================
@@ -23,8 +23,10 @@
 import os
 import struct
 import zlib
-from typing import List, Optional
-from .base_extractor import BaseExtractor, FileEntry, ExtractorRegistry
+import pickle
+import hashlib
+from typing import Dict, Iterator, List, Optional
+from .base_extractor import BaseExtractor, FileEntry, ExtractorRegistry, STREAM_CHUNK_SIZE
 
 
 # ==============================================================================
@@ -37,6 +39,19 @@ GRF_SIGNATURE = b"Master of Magic"
 # GRF header size
 GRF_HEADER_SIZE = 46
 
+# Header layout: signature, encryption key, table offset, seed, count + 7, version
+GRF_HEADER_STRUCT = struct.Struct('<15s15sIIII')
+
+# File table entry after the name: compressed size, aligned size, size, flags, offset
+GRF_ENTRY_STRUCT = struct.Struct('<IIIBI')
+
+# Read buffer for the archive handle: file-table order mostly follows data order,
+# so a large buffer serves runs of small entries from one read() syscall
+GRF_READ_BUFFER = 1 << 20
+
+# Bump when the cached file-table layout (see GRFExtractor.table_cache_dir) changes
+GRF_TABLE_CACHE_VERSION = 1
+
 # GRF version 0x200 (the version used by modern clients)
 GRF_VERSION_200 = 0x200
 
@@ -96,8 +111,13 @@ class GRFExtractor(BaseExtractor):
         archive_path (str): Path to the currently open GRF file
         version (int): GRF version number
         file_count (int): Number of files in the archive
+        table_cache_dir (str): If set, decoded file tables are cached here and
+            reused while the archive's size, mtime and table offset are unchanged
     """
     
+    # Directory for decoded file-table caches; None disables caching
+    table_cache_dir: Optional[str] = None
+    
     def __init__(self, archive_path: str = None):
         """
         Initialize the GRF extractor.
@@ -109,6 +129,7 @@ class GRFExtractor(BaseExtractor):
         self.file_count = 0
         self._file_handle = None
         self._file_table_offset = 0
+        self._file_index: Dict[str, FileEntry] = {}  # Normalized path -> entry
         
         # Call parent init (will open archive if path provided)
         super().__init__(archive_path)
@@ -170,7 +191,7 @@ class GRFExtractor(BaseExtractor):
         
         try:
             # Open file handle
-            self._file_handle = open(archive_path, 'rb')
+            self._file_handle = open(archive_path, 'rb', buffering=GRF_READ_BUFFER)
             
             # Read and validate header
             if not self._read_header():
@@ -203,6 +224,7 @@ class GRFExtractor(BaseExtractor):
         
         self._is_open = False
         self._file_list = []
+        self._file_index = {}
         self.version = 0
         self.file_count = 0
     
@@ -212,6 +234,11 @@ class GRFExtractor(BaseExtractor):
             return []
         return self._file_list.copy()
     
+    def iter_files(self) -> Iterator[FileEntry]:
+        """Iterate over the parsed file table without copying it."""
+        if self._is_open:
+            yield from self._file_list
+    
     def extract_file(self, file_path: str, output_path: str) -> bool:
         """
         Extract a single file from the GRF.
@@ -228,8 +255,9 @@ class GRFExtractor(BaseExtractor):
         if data is None:
             return False
         
-        # Ensure output directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Ensure output directory exists (unless the caller already did)
+        if self.create_output_dirs:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Write file
         try:
@@ -253,15 +281,7 @@ class GRFExtractor(BaseExtractor):
         if not self._is_open:
             return None
         
-        # Find the file entry (case-insensitive search)
-        path_lower = file_path.lower().replace('/', '\\')
-        entry = None
-        
-        for e in self._file_list:
-            if e.path.lower().replace('/', '\\') == path_lower:
-                entry = e
-                break
-        
+        entry = self._find_entry(file_path)
         if entry is None:
             return None
         
@@ -294,10 +314,51 @@ class GRFExtractor(BaseExtractor):
             print(f"[ERROR] Failed to read {file_path}: {e}")
             return None
     
+    def open_file_stream(self, file_path: str,
+                         chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield a file's contents in chunks.
+        
+        Stored entries (not compressed, not encrypted) are read straight from the
+        GRF in `chunk_size` pieces; everything else is decompressed whole first.
+        """
+        if not self._is_open:
+            return
+        
+        entry = self._find_entry(file_path)
+        if entry is None or entry.is_encrypted or entry.compressed_size != entry.size:
+            yield from super().open_file_stream(file_path, chunk_size)
+            return
+        
+        remaining = entry.size
+        offset = entry.offset
+        while remaining > 0:
+            # Seek every time: the caller may touch the handle between chunks
+            self._file_handle.seek(offset)
+            chunk = self._file_handle.read(min(chunk_size, remaining))
+            if not chunk:
+                print(f"[WARN] Truncated data for {file_path}")
+                return
+            offset += len(chunk)
+            remaining -= len(chunk)
+            yield chunk
+    
     # ==========================================================================
     # PRIVATE HELPER METHODS
     # ==========================================================================
     
+    def _find_entry(self, file_path: str) -> Optional[FileEntry]:
+        """Look up a file entry by path (case-insensitive, either separator)."""
+        return self._file_index.get(file_path.lower().replace('/', '\\'))
+    
+    def _build_file_index(self):
+        """Index _file_list by normalized path; the first entry for a path wins."""
+        index = {}
+        setdefault = index.setdefault
+        for entry in self._file_list:
+            setdefault(entry.path.lower().replace('/', '\\'), entry)
+        self._file_index = index
+    
     def _decompress_file_data(self, entry: FileEntry, raw_data: bytes, file_path: str) -> Optional[bytes]:
         """
         Decompress file data based on compression type.
@@ -390,28 +451,18 @@ class GRFExtractor(BaseExtractor):
             - Version: 4 bytes (uint32)
         """
         try:
-            # Read signature
-            signature = self._file_handle.read(15)
-            if signature != GRF_SIGNATURE:
+            header = self._file_handle.read(GRF_HEADER_SIZE)
+            if len(header) < GRF_HEADER_SIZE or not header.startswith(GRF_SIGNATURE):
                 print(f"[ERROR] Invalid GRF signature")
                 return False
             
-            # Skip encryption key (15 bytes)
-            self._file_handle.read(15)
-            
-            # Read file table offset
-            self._file_table_offset = struct.unpack('<I', self._file_handle.read(4))[0]
-            
-            # Skip seed (4 bytes)
-            self._file_handle.read(4)
+            # Encryption key and seed are unused
+            _, _, self._file_table_offset, _, raw_count, self.version = \
+                GRF_HEADER_STRUCT.unpack(header)
             
-            # Read file count (stored as count + 7 in the header)
-            raw_count = struct.unpack('<I', self._file_handle.read(4))[0]
+            # File count is stored as count + 7 in the header
             self.file_count = raw_count - 7
             
-            # Read version
-            self.version = struct.unpack('<I', self._file_handle.read(4))[0]
-            
             # Validate version
             if self.version != GRF_VERSION_200:
                 print(f"[WARN] Unsupported GRF version: 0x{self.version:X}")
@@ -430,6 +481,14 @@ class GRFExtractor(BaseExtractor):
         The file table is located at the end of the file (at _file_table_offset + header size).
         It contains compressed data with information about all files in the archive.
         """
+        cache_key = self._table_cache_key()
+        cached = self._load_cached_table(cache_key)
+        if cached is not None:
+            self._file_list = cached
+            self._build_file_index()
+            print(f"[INFO] Loaded {len(self._file_list)} file entries from GRF (cached table)")
+            return True
+        
         try:
             # Seek to file table
             self._file_handle.seek(GRF_HEADER_SIZE + self._file_table_offset)
@@ -448,11 +507,16 @@ class GRFExtractor(BaseExtractor):
                 print(f"[ERROR] Failed to decompress file table: {e}")
                 return False
             
-            # Parse file entries
+            # Parse file entries: one find() for the name and one precompiled
+            # unpack_from() for the fixed fields, with no intermediate slices
             self._file_list = []
+            append = self._file_list.append
+            unpack_entry = GRF_ENTRY_STRUCT.unpack_from
+            entry_size = GRF_ENTRY_STRUCT.size
+            table_len = len(table_data)
             offset = 0
             
-            while offset < len(table_data):
+            while offset < table_len:
                 # Read filename (null-terminated string)
                 name_end = table_data.find(b'\x00', offset)
                 if name_end == -1:
@@ -462,24 +526,13 @@ class GRFExtractor(BaseExtractor):
                 offset = name_end + 1
                 
                 # Check if enough data for entry info
-                if offset + 17 > len(table_data):
+                if offset + entry_size > table_len:
                     break
                 
                 # Read entry info
-                compressed_size = struct.unpack('<I', table_data[offset:offset+4])[0]
-                offset += 4
-                
-                compressed_size_aligned = struct.unpack('<I', table_data[offset:offset+4])[0]
-                offset += 4
-                
-                uncompressed_size = struct.unpack('<I', table_data[offset:offset+4])[0]
-                offset += 4
-                
-                flags = table_data[offset]
-                offset += 1
-                
-                file_offset = struct.unpack('<I', table_data[offset:offset+4])[0]
-                offset += 4
+                (compressed_size, compressed_size_aligned, uncompressed_size,
+                 flags, file_offset) = unpack_entry(table_data, offset)
+                offset += entry_size
                 
                 # Skip directories (flag 0)
                 if flags == 0:
@@ -496,14 +549,61 @@ class GRFExtractor(BaseExtractor):
                     offset=GRF_HEADER_SIZE + file_offset,
                     is_encrypted=is_encrypted
                 )
-                self._file_list.append(entry)
+                append(entry)
             
+            self._build_file_index()
             print(f"[INFO] Loaded {len(self._file_list)} file entries from GRF")
+            self._save_cached_table(cache_key)
             return True
             
         except Exception as e:
             print(f"[ERROR] Failed to read file table: {e}")
             return False
+    
+    # ==========================================================================
+    # FILE TABLE CACHE
+    # ==========================================================================
+    
+    def _table_cache_path(self) -> Optional[str]:
+        """Cache file for the open archive (named by a hash of its absolute path)."""
+        if not self.table_cache_dir:
+            return None
+        name = hashlib.blake2b(os.path.abspath(self.archive_path).encode('utf-8', 'surrogatepass'),
+                               digest_size=16).hexdigest()
+        return os.path.join(self.table_cache_dir, name + '.idx')
+    
+    def _table_cache_key(self) -> Optional[tuple]:
+        """What a cached table must match to be reused (None if caching is off)."""
+        if not self.table_cache_dir:
+            return None
+        st = os.fstat(self._file_handle.fileno())
+        return (GRF_TABLE_CACHE_VERSION, st.st_size, st.st_mtime_ns,
+                self._file_table_offset, self.file_count)
+    
+    def _load_cached_table(self, cache_key: Optional[tuple]) -> Optional[List[FileEntry]]:
+        """Return the cached entry list if it is present and still valid."""
+        if cache_key is None:
+            return None
+        try:
+            with open(self._table_cache_path(), 'rb') as f:
+                key, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return None
+        return entries if key == cache_key else None
+    
+    def _save_cached_table(self, cache_key: Optional[tuple]):
+        """Write the decoded table to the cache (best effort, replaced atomically)."""
+        if cache_key is None:
+            return
+        path = self._table_cache_path()
+        tmp_path = path + '.tmp'
+        try:
+            os.makedirs(self.table_cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((cache_key, self._file_list), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not cache GRF file table: {e}")
 
 
 # ==============================================================================
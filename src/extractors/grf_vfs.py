@@ -24,6 +24,7 @@
 
 import os
 import struct
+import threading
 import zlib
 import lzma
 from typing import List, Optional, Dict, Tuple
@@ -43,6 +44,9 @@ except ImportError:
     DES_AVAILABLE = False
     print("[WARN] DES decryption not available")
 
+# Kernel-side file-to-file copy (Linux); stored entries can skip Python buffers entirely
+SENDFILE_AVAILABLE = hasattr(os, 'sendfile')
+
 
 # ==============================================================================
 # GRF FILE ENTRY
@@ -110,6 +114,7 @@ class GRFArchive:
         self._file_handle = None
         self._file_table_offset = 0
         self._entries: Dict[str, GRFFileEntry] = {}  # Normalized path -> entry
+        self._read_lock = threading.Lock()  # seek+read on the shared handle must not interleave
         
     def open(self) -> bool:
         """
@@ -181,11 +186,12 @@ class GRFArchive:
             return None
         
         try:
-            # Seek to file data (offset is relative to start of file after header)
-            self._file_handle.seek(GRF_HEADER_SIZE + entry.offset)
-            
-            # Read compressed data
-            compressed_data = self._file_handle.read(entry.compressed_size)
+            with self._read_lock:
+                # Seek to file data (offset is relative to start of file after header)
+                self._file_handle.seek(GRF_HEADER_SIZE + entry.offset)
+                
+                # Read compressed data
+                compressed_data = self._file_handle.read(entry.compressed_size)
             
             if len(compressed_data) != entry.compressed_size:
                 print(f"[WARN] Read {len(compressed_data)} bytes, expected {entry.compressed_size} for {entry.path}")
@@ -197,6 +203,35 @@ class GRFArchive:
             print(f"[ERROR] Failed to read {entry.path} from GRF: {e}")
             return None
     
+    def sendfile_to(self, entry: GRFFileEntry, dst_fd: int) -> bool:
+        """
+        Copy an entry's raw bytes straight into `dst_fd` with os.sendfile.
+        
+        Uses explicit source offsets, so the shared handle's position is untouched
+        and no lock is needed.
+        
+        Returns:
+            True if all bytes were copied, False on error or short archive
+        """
+        if not self._file_handle or not SENDFILE_AVAILABLE:
+            return False
+        
+        src_fd = self._file_handle.fileno()
+        offset = GRF_HEADER_SIZE + entry.offset
+        remaining = entry.compressed_size
+        try:
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if sent == 0:
+                    break  # Hit EOF: archive is shorter than the table claims
+                offset += sent
+                remaining -= sent
+        except OSError as e:
+            print(f"[WARN] sendfile failed for {entry.path}: {e}")
+            return False
+        
+        return remaining == 0
+    
     def _read_header(self) -> bool:
         """Read and validate GRF header."""
         try:
@@ -409,6 +444,8 @@ class GRFVirtualFileSystem:
         self._cache: OrderedDict[str, bytes] = OrderedDict()  # LRU cache
         self._cache_size_limit = cache_size_mb * 1024 * 1024  # Convert to bytes
         self._cache_size_current = 0
+        # read_file may be called from preview/extract worker threads
+        self._cache_lock = threading.Lock()
         
         # Statistics
         self._stats = {
@@ -581,12 +618,13 @@ class GRFVirtualFileSystem:
         normalized_path = path.lower().replace('\\', '/')
         
         # Check cache first
-        if normalized_path in self._cache:
-            # Move to end (most recently used)
-            data = self._cache.pop(normalized_path)
-            self._cache[normalized_path] = data
-            self._stats['cache_hits'] += 1
-            return data
+        with self._cache_lock:
+            data = self._cache.get(normalized_path)
+            if data is not None:
+                # Move to end (most recently used)
+                self._cache.move_to_end(normalized_path)
+                self._stats['cache_hits'] += 1
+                return data
         
         self._stats['cache_misses'] += 1
         
@@ -596,12 +634,7 @@ class GRFVirtualFileSystem:
             return None
         
         # Find archive containing this file
-        archive = None
-        for arch in self._archives:
-            if arch.grf_path == entry.grf_path:
-                archive = arch
-                break
-        
+        archive = self._find_archive(entry)
         if not archive:
             return None
         
@@ -634,6 +667,55 @@ class GRFVirtualFileSystem:
         self._stats['files_read'] += 1
         return data
     
+    def can_sendfile(self, path: str) -> bool:
+        """
+        Check whether a file is stored raw (no compression or encryption),
+        so sendfile_to() can copy it without decoding.
+        """
+        if not SENDFILE_AVAILABLE:
+            return False
+        entry = self._file_index.get(path.lower().replace('\\', '/'))
+        return (entry is not None and entry.compression_type == 0
+                and not entry.is_encrypted() and entry.compressed_size > 0)
+    
+    def sendfile_to(self, fd: int, path: str) -> bool:
+        """
+        Write a stored (uncompressed) file into an open file descriptor,
+        copying kernel-to-kernel instead of through a bytes object.
+        
+        On failure the destination is truncated back to empty.
+        
+        Args:
+            fd: Destination file descriptor, opened for writing
+            path: File path (normalized or original format)
+            
+        Returns:
+            True if copied; False if the file is not stored raw or the copy
+            failed (callers should fall back to read_file)
+        """
+        if not self.can_sendfile(path):
+            return False
+        
+        entry = self._file_index.get(path.lower().replace('\\', '/'))
+        archive = self._find_archive(entry)
+        if not archive:
+            return False
+        
+        if not archive.sendfile_to(entry, fd):
+            os.ftruncate(fd, 0)
+            os.lseek(fd, 0, os.SEEK_SET)
+            return False
+        
+        self._stats['files_read'] += 1
+        return True
+    
+    def _find_archive(self, entry: GRFFileEntry) -> Optional[GRFArchive]:
+        """Return the loaded archive an entry came from."""
+        for arch in self._archives:
+            if arch.grf_path == entry.grf_path:
+                return arch
+        return None
+    
     def get_file_info(self, path: str) -> Optional[GRFFileEntry]:
         """
         Get metadata about a file without reading it.
@@ -682,8 +764,9 @@ class GRFVirtualFileSystem:
     
     def clear_cache(self):
         """Clear the memory cache."""
-        self._cache.clear()
-        self._cache_size_current = 0
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_size_current = 0
     
     def _cache_file(self, path: str, data: bytes):
         """Add file to cache, evicting old entries if needed."""
@@ -693,15 +776,21 @@ class GRFVirtualFileSystem:
         if data_size > self._cache_size_limit:
             return  # Don't cache huge files
         
-        # Evict old entries until we have space
-        while self._cache_size_current + data_size > self._cache_size_limit and self._cache:
-            # Remove oldest entry (first in OrderedDict)
-            oldest_path, oldest_data = self._cache.popitem(last=False)
-            self._cache_size_current -= len(oldest_data)
-        
-        # Add new entry
-        self._cache[path] = data
-        self._cache_size_current += data_size
+        with self._cache_lock:
+            # Another thread may have cached the same file meanwhile
+            old = self._cache.pop(path, None)
+            if old is not None:
+                self._cache_size_current -= len(old)
+            
+            # Evict old entries until we have space
+            while self._cache_size_current + data_size > self._cache_size_limit and self._cache:
+                # Remove oldest entry (first in OrderedDict)
+                oldest_path, oldest_data = self._cache.popitem(last=False)
+                self._cache_size_current -= len(oldest_data)
+            
+            # Add new entry
+            self._cache[path] = data
+            self._cache_size_current += data_size
     
     def _decompress_zlib_multiple_strategies(self, raw_data: bytes, entry: GRFFileEntry) -> Optional[bytes]:
         """
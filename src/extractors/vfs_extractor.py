@@ -43,7 +43,7 @@
 import os
 import struct
 import zlib
-from typing import List, Optional, BinaryIO, Dict
+from typing import Iterator, List, Optional, BinaryIO, Dict
 
 from .base_extractor import BaseExtractor, ExtractorRegistry, FileEntry
 
@@ -316,23 +316,29 @@ class VFSExtractor(BaseExtractor):
         Returns:
             List of FileEntry objects for each file
         """
-        result = []
-        
+        return list(self.iter_files())
+    
+    def iter_files(self) -> Iterator[FileEntry]:
+        """
+        Yield a FileEntry per (non-deleted) file, built on demand rather than
+        as one list up front.
+        """
         for path, entry in self.file_entries.items():
             # Skip deleted files
             if entry.is_deleted:
                 continue
             
-            file_entry = FileEntry(
+            yield FileEntry(
                 path=path,
                 size=entry.uncompressed_size,
                 compressed_size=entry.compressed_size,
                 offset=entry.offset,
                 is_encrypted=entry.is_encrypted
             )
-            result.append(file_entry)
-        
-        return result
+    
+    def get_file_count(self) -> int:
+        """Get the number of (non-deleted) files in the archive."""
+        return sum(1 for entry in self.file_entries.values() if not entry.is_deleted)
     
     # -------------------------------------------------------------------------
     # FILE EXTRACTION
@@ -354,8 +360,9 @@ class VFSExtractor(BaseExtractor):
         if data is None:
             return False
         
-        # Create output directory
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Create output directory (unless the caller already did)
+        if self.create_output_dirs:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
         # Write file
         try:
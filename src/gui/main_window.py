@@ -13,9 +13,16 @@
 
 import os
 import sys
+import bisect
+import ntpath
 import hashlib
+import functools
+import itertools
+import collections
 import threading
-from typing import Optional, List, Dict
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 
 # ==============================================================================
@@ -29,46 +36,225 @@ try:
         QFileDialog, QMessageBox, QGroupBox, QSplitter, QTreeWidget,
         QTreeWidgetItem, QStatusBar, QToolBar, QSpacerItem, QSizePolicy,
         QDialog, QFormLayout, QDialogButtonBox, QCheckBox, QSpinBox,
-        QListWidget, QListWidgetItem, QFrame, QGridLayout, QSlider,
+        QListView, QFrame, QGridLayout, QSlider,
         QScrollArea, QMenu, QInputDialog
     )
-    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+    from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QModelIndex
     from PyQt6.QtGui import QAction, QIcon, QFont, QColor
+    from src.gui.models import LazyListModel
     PYQT_AVAILABLE = True
 except ImportError:
     PYQT_AVAILABLE = False
     print("[ERROR] PyQt6 is not installed. Install with: pip install PyQt6")
 
 # ==============================================================================
-# GUI MODULE IMPORTS
+# CONTENT HASHING
 # ==============================================================================
-# Import optional GUI widgets for RO-specific features
+# Baseline/compare hashes only have to detect changed files, not resist attacks,
+# so use the fastest 128-bit hash available: BLAKE3 (SIMD), then XXH3, then
+# hashlib's blake2b. A Baseline records the algorithm it was built with.
 try:
-    from src.gui.character_designer import CharacterDesignerWidget
-    CHARACTER_DESIGNER_AVAILABLE = True
+    import blake3
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    CHARACTER_DESIGNER_AVAILABLE = False
-    print("[INFO] Character Designer module not loaded - this is optional")
+    BLAKE3_AVAILABLE = False
 
 try:
-    from src.gui.act_spr_editor import ACTSPREditorWidget
-    ACT_SPR_EDITOR_AVAILABLE = True
+    import xxhash
+    XXHASH_AVAILABLE = True
 except ImportError:
-    ACT_SPR_EDITOR_AVAILABLE = False
-    print("[INFO] ACT/SPR Editor module not loaded - this is optional")
+    XXHASH_AVAILABLE = False
 
-try:
-    from src.gui.grf_browser import GRFBrowserWidget
-    GRF_BROWSER_AVAILABLE = True
-except ImportError:
-    GRF_BROWSER_AVAILABLE = False
-    print("[INFO] GRF Browser module not loaded - this is optional")
+if BLAKE3_AVAILABLE:
+    CONTENT_HASH_ALGORITHM = 'blake3'
+elif XXHASH_AVAILABLE:
+    CONTENT_HASH_ALGORITHM = 'xxh3_128'
+else:
+    CONTENT_HASH_ALGORITHM = 'blake2b'
+
+# Files read and queued for hashing at a time (bounds file data held in memory)
+_HASH_BATCH = 1024
+
+# Files at least this large are hashed chunk by chunk as they are read
+_STREAM_HASH_MIN = 8 * 1024 * 1024
+
+# Minimum seconds between progress signals from the per-file loops
+_PROGRESS_INTERVAL = 0.1
+
+
+def _content_digest(data: bytes, algorithm: str = CONTENT_HASH_ALGORITHM) -> bytes:
+    """Raw 16-byte digest of `data` using a baseline hash algorithm name."""
+    if algorithm == 'blake3':
+        # Single-threaded: callers already run this on the shared hash pool
+        return blake3.blake3(data).digest(length=16)
+    if algorithm == 'xxh3_128':
+        return xxhash.xxh3_128(data).digest()
+    if algorithm == 'blake2b':
+        return hashlib.blake2b(data, digest_size=16).digest()
+    return hashlib.new(algorithm, data).digest()  # e.g. 'md5'
+
+
+def _stream_digest(chunks, algorithm: str = CONTENT_HASH_ALGORITHM):
+    """
+    Incrementally hash an iterable of byte chunks.
+    
+    Returns:
+        (digest, total_size); same digest as _content_digest of the joined chunks
+    """
+    if algorithm == 'blake3':
+        # Runs on the reader thread, outside the hash pool, so BLAKE3 may use its own threads
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    elif algorithm == 'xxh3_128':
+        hasher = xxhash.xxh3_128()
+    elif algorithm == 'blake2b':
+        hasher = hashlib.blake2b(digest_size=16)
+    else:
+        hasher = hashlib.new(algorithm)
+    total = 0
+    for chunk in chunks:
+        hasher.update(chunk)
+        total += len(chunk)
+    if algorithm == 'blake3':
+        return hasher.digest(length=16), total
+    return hasher.digest(), total
+
+
+class Baseline(dict):
+    """
+    Vanilla baseline: {path_lower: (digest, size, archive_idx)}.
+    
+    Entries are plain tuples; `digest` is the raw 16-byte content hash, `size`
+    the uncompressed size declared by the archive's file table, and
+    `archive_idx` indexes `archives`, so each archive name is stored once.
+    `algorithm` names the hash every digest was made with.
+    """
+    
+    def __init__(self, algorithm: str = CONTENT_HASH_ALGORITHM):
+        super().__init__()
+        self.algorithm = algorithm
+        self.archives: List[str] = []
+    
+    def add_archive(self, name: str) -> int:
+        """Register an archive name and return its index."""
+        self.archives.append(name)
+        return len(self.archives) - 1
+
+
+def _baseline_key(path: str) -> str:
+    """
+    Canonical baseline key for an archive path: lowercase, backslash-separated,
+    no leading separator and no doubled or '.'/'..' components.
+    
+    Archive tables almost always hold such paths already, so the lowercase form
+    is returned as-is unless it contains something worth normalizing.
+    """
+    key = path.lower()
+    if '/' in key or key.startswith('\\') or '\\\\' in key or '.\\' in key:
+        key = ntpath.normpath(key.replace('/', '\\')).lstrip('\\')
+    return key
+
+# ==============================================================================
+# ARCHIVE DISCOVERY
+# ==============================================================================
+# Archive extensions per format: lowercase tuples, built once, so discovery is a
+# single str.endswith(tuple) test per file name
+_ARCHIVE_EXTENSIONS: Dict[str, Tuple[str, ...]] = {
+    fmt: tuple(ext.lower() for ext in exts)
+    for fmt, exts in {
+        'grf': ('.grf', '.gpf'),
+        'vfs': ('.vfs',),
+        'pak': ('.pak',),
+        'pkg': ('.pkg',),
+        'dat': ('.dat', '.u'),
+        'other': ('*',)
+    }.items()
+}
+
+
+def _find_archives(root: str, ext_tuple: tuple):
+    """
+    Yield paths of files under `root` whose lowercased name ends with one of
+    `ext_tuple`, in the same order os.walk would list them.
+    
+    Iterative os.scandir walk: the DirEntry type info is used directly (no
+    per-entry stat on most filesystems), symlinked directories are not followed,
+    and unreadable directories are skipped. Being a generator, callers can start
+    on the first archive before the walk finishes.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(ext_tuple):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+@functools.lru_cache(maxsize=None)
+def _get_extractor_class(game_format: str):
+    """Extractor class for a format, imported once per format (None if unavailable)."""
+    try:
+        if game_format == 'grf':
+            from src.extractors.grf_extractor import GRFExtractor
+            return GRFExtractor
+        elif game_format == 'vfs':
+            from src.extractors.vfs_extractor import VFSExtractor
+            return VFSExtractor
+        else:
+            from src.extractors.generic_extractor import GenericExtractor
+            return GenericExtractor
+    except ImportError as e:
+        print(f"[WARN] Extractor not available: {e}")
+        return None
+
+# ==============================================================================
+# GUI MODULE IMPORTS
+# ==============================================================================
+# The optional RO widgets (GRF Browser, ACT/SPR Editor, Character Designer) pull
+# in PIL and the sprite parsers; they are imported when their tab is first
+# opened (see MainWindow._add_lazy_tab), not at startup.
+
+
+# ==============================================================================
+# LAZY DIALOG BASE
+# ==============================================================================
+class LazyDialog(QDialog):
+    """
+    QDialog that builds its widgets (setup_ui) when first shown rather than
+    in __init__. Building happens in setVisible, before Qt sizes the window,
+    so the initial layout is the same as an eagerly built dialog.
+    """
+    _ui_built = False
+    
+    def setup_ui(self):
+        """Build the dialog UI (subclasses override)."""
+    
+    def ensure_ui(self):
+        """Build the UI now if it has not been built yet."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+    
+    def setVisible(self, visible: bool):
+        if visible:
+            self.ensure_ui()
+        super().setVisible(visible)
 
 
 # ==============================================================================
 # ADD GAME DIALOG
 # ==============================================================================
-class AddGameDialog(QDialog):
+class AddGameDialog(LazyDialog):
     """
     Dialog for adding a new game to the database.
     
@@ -79,11 +265,14 @@ class AddGameDialog(QDialog):
     - Vanilla client path (optional)
     """
     
+    # Indexed by format_combo position: GRF, VFS, PAK, PKG, DAT, Other
+    _FORMAT_EXTENSIONS = (".grf, .gpf", ".vfs", ".pak", ".pkg", ".dat, .u", "*")
+    _FORMAT_MAP = ("grf", "vfs", "pak", "pkg", "dat", "other")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Add New Game")
         self.setMinimumWidth(500)
-        self.setup_ui()
     
     def setup_ui(self):
         """Build the dialog UI."""
@@ -138,15 +327,9 @@ class AddGameDialog(QDialog):
     
     def _update_extensions(self):
         """Update extensions based on format selection."""
-        format_extensions = {
-            0: ".grf, .gpf",      # GRF
-            1: ".vfs",            # VFS
-            2: ".pak",            # PAK
-            3: ".pkg",            # PKG
-            4: ".dat, .u",        # DAT
-            5: "*"                # Other
-        }
-        self.extensions_edit.setText(format_extensions.get(self.format_combo.currentIndex(), "*"))
+        idx = self.format_combo.currentIndex()
+        in_range = 0 <= idx < len(self._FORMAT_EXTENSIONS)
+        self.extensions_edit.setText(self._FORMAT_EXTENSIONS[idx] if in_range else "*")
     
     def _browse_vanilla(self):
         """Browse for vanilla client folder."""
@@ -156,12 +339,11 @@ class AddGameDialog(QDialog):
     
     def get_data(self) -> dict:
         """Return the dialog data."""
-        format_map = {
-            0: "grf", 1: "vfs", 2: "pak", 3: "pkg", 4: "dat", 5: "other"
-        }
+        self.ensure_ui()
+        idx = self.format_combo.currentIndex()
         return {
             'name': self.name_edit.text().strip(),
-            'format': format_map.get(self.format_combo.currentIndex(), "other"),
+            'format': self._FORMAT_MAP[idx] if 0 <= idx < len(self._FORMAT_MAP) else "other",
             'extensions': self.extensions_edit.text().strip(),
             'vanilla_path': self.vanilla_path_edit.text().strip()
         }
@@ -170,7 +352,7 @@ class AddGameDialog(QDialog):
 # ==============================================================================
 # ADD SERVER DIALOG
 # ==============================================================================
-class AddServerDialog(QDialog):
+class AddServerDialog(LazyDialog):
     """
     Dialog for adding a new private server.
     
@@ -186,7 +368,6 @@ class AddServerDialog(QDialog):
         self.setWindowTitle("Add New Server")
         self.setMinimumWidth(500)
         self.games = games or []
-        self.setup_ui()
     
     def setup_ui(self):
         """Build the dialog UI."""
@@ -244,6 +425,7 @@ class AddServerDialog(QDialog):
     
     def get_data(self) -> dict:
         """Return the dialog data."""
+        self.ensure_ui()
         return {
             'name': self.name_edit.text().strip(),
             'game_id': self.game_combo.currentData(),
@@ -290,15 +472,22 @@ class ExtractWorker(QThread):
                        - "compare": Compare server against baseline
                        - "export_custom": Export only custom/modified files
                        - "quick_extract_custom": CHAIN of scan → compare → export
+                       - "save_grf": Write a GRFEditor to disk (editor, path)
+                       - "add_grf_directory": Add a folder to a GRFEditor
+                         (editor, local_dir, grf_base, recursive)
             **kwargs: Operation-specific parameters
         """
         super().__init__()
         self.operation = operation
         self.kwargs = kwargs
         self._cancelled = False
+        self._last_emit = 0.0  # time.monotonic() of the last per-file progress signal
+        self._dirs_created = set()  # output directories already made this run
+        self._hash_pool = None  # executor shared by every archive hashed in this run
         
         # For chained operations, store intermediate results
         self._baseline_hashes = {}
+        self._baseline_norm = None  # (source baseline, {canonical key: entry}), see _normalized_baseline()
         self._comparison_results = {}
         self._custom_files = []
     
@@ -332,6 +521,10 @@ class ExtractWorker(QThread):
             elif self.operation == "quick_extract_custom":
                 # NEW: Chained operation - Scan → Compare → Export
                 self._quick_extract_custom()
+            elif self.operation == "save_grf":
+                self._save_grf()
+            elif self.operation == "add_grf_directory":
+                self._add_grf_directory()
             else:
                 self.error.emit(f"Unknown operation: {self.operation}")
                 
@@ -340,6 +533,71 @@ class ExtractWorker(QThread):
             import traceback
             error_msg = f"{str(e)}\n{traceback.format_exc()}"
             self.error.emit(error_msg)
+        finally:
+            if self._hash_pool is not None:
+                self._hash_pool.shutdown(wait=True, cancel_futures=True)
+                self._hash_pool = None
+    
+    # ==========================================================================
+    # GRF EDITOR OPERATIONS
+    # ==========================================================================
+    # Run here so repacking or adding a large folder doesn't freeze the window.
+    # The GUI keeps the editor tab disabled while one of these runs.
+    
+    def _save_grf(self):
+        """Save the GRFEditor in kwargs['editor'] (to kwargs['path'] if given)."""
+        editor = self.kwargs['editor']
+        path = self.kwargs.get('path')
+        
+        self.log.emit(f"Saving GRF{' as ' + path if path else ''}...")
+        if not editor.save(path):
+            self.error.emit("Failed to save GRF")
+            return
+        
+        self.finished.emit({
+            'type': 'grf_save',
+            'path': editor.grf_path,
+            'saved_as': bool(path),
+            'cancelled': False
+        })
+    
+    def _add_grf_directory(self):
+        """Add kwargs['local_dir'] to the GRFEditor in kwargs['editor']."""
+        editor = self.kwargs['editor']
+        local_dir = self.kwargs['local_dir']
+        
+        if not os.path.isdir(local_dir):
+            self.error.emit(f"Directory not found: {local_dir}")
+            return
+        
+        self.log.emit(f"Adding directory: {local_dir}")
+        batches = editor.add_directory_iter(local_dir, self.kwargs['grf_base'],
+                                            recursive=self.kwargs.get('recursive', True))
+        count = 0
+        added = []      # GRF paths that were not in the editor before
+        replaced = 0    # existing entries overwritten (their listed casing may change)
+        for batch in batches:
+            if self._cancelled:
+                # Files added so far stay in the editor (unsaved), like a partial extract
+                break
+            for local_path, grf_path in batch:
+                is_new = grf_path.lower() not in editor.files
+                if editor.add_file(local_path, grf_path):
+                    count += 1
+                    if is_new:
+                        added.append(grf_path)
+                    else:
+                        replaced += 1
+            # One signal per batch; the total isn't known up front, so 0 = busy bar
+            self.progress.emit(count, 0, f"Adding: {batch[-1][1]}")
+        
+        self.finished.emit({
+            'type': 'grf_add_directory',
+            'count': count,
+            'added': added,
+            'replaced': replaced,
+            'cancelled': self._cancelled
+        })
     
     # ==========================================================================
     # NEW: QUICK EXTRACT CUSTOM - CHAINED OPERATION
@@ -524,14 +782,8 @@ class ExtractWorker(QThread):
         Returns:
             True if successful, False if error
         """
-        # Find archive files
-        archives = []
-        extensions = self._get_extensions(game_format)
-        
-        for root, dirs, files in os.walk(path):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in extensions):
-                    archives.append(os.path.join(root, f))
+        # Find archive files (listed up front: progress needs the total)
+        archives = list(_find_archives(path, self._get_extensions(game_format)))
         
         if not archives:
             self.error.emit(f"No {game_format.upper()} archives found in {path}")
@@ -540,7 +792,7 @@ class ExtractWorker(QThread):
         self.log.emit(f"  Found {len(archives)} archive(s)")
         
         # Process each archive
-        self._baseline_hashes = {}
+        self._baseline_hashes = Baseline()
         total_files = 0
         
         for i, archive_path in enumerate(archives):
@@ -548,6 +800,7 @@ class ExtractWorker(QThread):
                 return False
             
             archive_name = os.path.basename(archive_path)
+            archive_idx = self._baseline_hashes.add_archive(archive_name)
             self.progress.emit(i, len(archives), f"Scanning: {archive_name}")
             self.log.emit(f"  Scanning: {archive_name}")
             
@@ -557,27 +810,16 @@ class ExtractWorker(QThread):
             
             try:
                 if extractor.open(archive_path):
-                    files = extractor.list_files()
-                    
-                    for j, entry in enumerate(files):
-                        if self._cancelled:
-                            extractor.close()
-                            return False
-                        
-                        if j % 100 == 0:
-                            self.progress.emit(j, len(files), f"Hashing: {entry.path[:40]}...")
-                        
-                        data = extractor.get_file_data(entry.path)
-                        if data:
-                            file_hash = hashlib.md5(data).hexdigest()
-                            self._baseline_hashes[entry.path.lower()] = {
-                                'hash': file_hash,
-                                'size': len(data),
-                                'archive': archive_name
-                            }
-                            total_files += 1
+                    baseline = self._baseline_hashes
+                    for entry, size, digest in self._hash_entries(
+                            extractor, extractor.iter_files(), extractor.get_file_count(), "Hashing"):
+                        # Table size (not len(data)) so compare can check it before reading
+                        baseline[_baseline_key(entry.path)] = (digest, entry.size, archive_idx)
+                        total_files += 1
                     
                     extractor.close()
+                    if self._cancelled:
+                        return False
             except Exception as e:
                 self.log.emit(f"    [ERROR] {e}")
         
@@ -594,19 +836,6 @@ class ExtractWorker(QThread):
         Returns:
             True if successful, False if error
         """
-        # Find archives
-        archives = []
-        extensions = self._get_extensions(game_format)
-        
-        for root, dirs, files in os.walk(source):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in extensions):
-                    archives.append(os.path.join(root, f))
-        
-        if not archives:
-            self.error.emit(f"No archives found in {source}")
-            return False
-        
         self._comparison_results = {
             'identical': [],
             'modified': [],
@@ -614,9 +843,15 @@ class ExtractWorker(QThread):
             'missing': []
         }
         
-        server_files = {}
+        server_files = set()
+        archive_count = 0
+        # Hash server files with whatever algorithm the baseline was built with
+        algorithm = getattr(self._baseline_hashes, 'algorithm', CONTENT_HASH_ALGORITHM)
+        baseline = self._normalized_baseline()
         
-        for archive_path in archives:
+        # Archives are compared as the directory walk finds them
+        for archive_path in _find_archives(source, self._get_extensions(game_format)):
+            archive_count += 1
             if self._cancelled:
                 return False
             
@@ -629,47 +864,149 @@ class ExtractWorker(QThread):
             
             try:
                 if extractor.open(archive_path):
-                    files = extractor.list_files()
+                    total = extractor.get_file_count()
+                    seen = [0]  # entries done, shared with _hash_entries for progress
                     
-                    for j, entry in enumerate(files):
-                        if self._cancelled:
-                            extractor.close()
-                            return False
-                        
-                        if j % 500 == 0:
-                            self.progress.emit(j, len(files), f"Comparing: {entry.path[:40]}...")
-                        
-                        path_lower = entry.path.lower()
-                        data = extractor.get_file_data(entry.path)
+                    # A different declared size means different contents: mark those
+                    # modified from the file table alone and only read/hash the rest
+                    def same_size_entries(entries):
+                        for entry in entries:
+                            path_lower = _baseline_key(entry.path)
+                            base = baseline.get(path_lower)
+                            if base is not None and base[1] != entry.size:
+                                server_files.add(path_lower)
+                                self._comparison_results['modified'].append(entry.path)
+                                if self._progress_due():
+                                    self.progress.emit(seen[0], total, f"Comparing: {entry.path[:40]}...")
+                                seen[0] += 1
+                            else:
+                                yield entry
+                    
+                    for entry, size, digest in self._hash_entries(
+                            extractor, same_size_entries(extractor.iter_files()),
+                            total, "Comparing", algorithm, seen):
+                        path_lower = _baseline_key(entry.path)
+                        server_files.add(path_lower)
                         
-                        if data:
-                            file_hash = hashlib.md5(data).hexdigest()
-                            server_files[path_lower] = {
-                                'hash': file_hash,
-                                'size': len(data),
-                                'path': entry.path
-                            }
-                            
-                            # Compare with baseline
-                            if path_lower in self._baseline_hashes:
-                                if self._baseline_hashes[path_lower]['hash'] == file_hash:
-                                    self._comparison_results['identical'].append(entry.path)
-                                else:
-                                    self._comparison_results['modified'].append(entry.path)
+                        # Compare with baseline (raw digest bytes)
+                        base = baseline.get(path_lower)
+                        if base is not None:
+                            if base[0] == digest:
+                                self._comparison_results['identical'].append(entry.path)
                             else:
-                                self._comparison_results['new'].append(entry.path)
+                                self._comparison_results['modified'].append(entry.path)
+                        else:
+                            self._comparison_results['new'].append(entry.path)
                     
                     extractor.close()
+                    if self._cancelled:
+                        return False
             except Exception as e:
                 self.log.emit(f"    [ERROR] {e}")
         
-        # Find missing files
-        for path in self._baseline_hashes:
-            if path not in server_files:
-                self._comparison_results['missing'].append(path)
+        if archive_count == 0:
+            self.error.emit(f"No archives found in {source}")
+            return False
+        
+        # Find missing files (set difference on the key view runs in C; sorted for stable output)
+        self._comparison_results['missing'] = sorted(baseline.keys() - server_files)
         
         return True
     
+    def _normalized_baseline(self) -> dict:
+        """
+        The current baseline keyed by _baseline_key(), built once per baseline.
+        
+        Baselines scanned or loaded by this version are already canonical and
+        are used directly; older or hand-made ones are re-keyed a single time
+        and the result cached for as long as that baseline is in use.
+        """
+        source = self._baseline_hashes
+        if self._baseline_norm is not None and self._baseline_norm[0] is source:
+            return self._baseline_norm[1]
+        
+        norm = source
+        if any(_baseline_key(k) != k for k in source):
+            norm = {_baseline_key(k): v for k, v in source.items()}
+        self._baseline_norm = (source, norm)
+        return norm
+    
+    def _progress_due(self) -> bool:
+        """
+        True at most once per _PROGRESS_INTERVAL. Each progress signal is a queued
+        cross-thread call, so per-file loops emit on a timer instead of every N files.
+        """
+        now = time.monotonic()
+        if now - self._last_emit >= _PROGRESS_INTERVAL:
+            self._last_emit = now
+            return True
+        return False
+    
+    def _hash_entries(self, extractor, files, total: int, label: str,
+                      algorithm: str = CONTENT_HASH_ALGORITHM, seen: Optional[list] = None):
+        """
+        Yield (entry, size, digest) for every readable file in `files` (any
+        iterable of entries, consumed lazily), in order. `total` is only the
+        progress denominator; `seen` is an optional one-item [count] list for
+        callers that filter entries out of `files` and count those themselves.
+        
+        Reads stay on this thread (extractors share one file handle); hashing runs
+        on a thread pool, since the hash functions release the GIL on large
+        buffers. Files go in batches of _HASH_BATCH, and the reads for one batch
+        are issued before the previous batch's digests are collected, so the
+        disk and the pool stay busy at the same time with at most two batches
+        of file data held. Files of _STREAM_HASH_MIN bytes or more are hashed
+        here while streaming (extractor.open_file_stream) so they are never held
+        whole. Stops early on cancellation.
+        """
+        pool = self._get_hash_pool()
+        files = iter(files)
+        pending = []  # previous batch, hashing while the next one is read
+        batch = []
+        if seen is None:
+            seen = [0]
+        try:
+            while True:
+                chunk = list(itertools.islice(files, _HASH_BATCH))
+                batch = []
+                for entry in chunk:
+                    if self._cancelled:
+                        return
+                    if self._progress_due():
+                        self.progress.emit(seen[0], total, f"{label}: {entry.path[:40]}...")
+                    seen[0] += 1
+                    
+                    if entry.size >= _STREAM_HASH_MIN:
+                        digest, size = _stream_digest(extractor.open_file_stream(entry.path), algorithm)
+                        if size:
+                            done = Future()
+                            done.set_result(digest)
+                            batch.append((entry, size, done))
+                        continue
+                    
+                    data = extractor.get_file_data(entry.path)
+                    if data:
+                        batch.append((entry, len(data), pool.submit(_content_digest, data, algorithm)))
+                
+                # Collect the previous batch now that this one is queued
+                for entry, size, future in pending:
+                    if self._cancelled:
+                        return
+                    yield entry, size, future.result()
+                pending, batch = batch, []
+                if not chunk:
+                    return
+        finally:
+            # Drop queued work if the caller stopped early (cancel or error)
+            for _, _, future in itertools.chain(pending, batch):
+                future.cancel()
+    
+    def _get_hash_pool(self):
+        """Create the run's hashing thread pool on first use."""
+        if self._hash_pool is None:
+            self._hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        return self._hash_pool
+    
     def _export_custom_internal(self, source: str, output: str, game_format: str) -> bool:
         """
         Internal export logic.
@@ -683,15 +1020,7 @@ class ExtractWorker(QThread):
             True if successful, False if error
         """
         os.makedirs(output, exist_ok=True)
-        
-        # Find archives
-        archives = []
-        extensions = self._get_extensions(game_format)
-        
-        for root, dirs, files in os.walk(source):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in extensions):
-                    archives.append(os.path.join(root, f))
+        out_prefix = os.path.join(output, '')  # joined once; sanitized paths are always relative
         
         # Convert to set for fast lookup
         custom_set = set(f.lower() for f in self._custom_files)
@@ -699,19 +1028,19 @@ class ExtractWorker(QThread):
         self._export_count = 0
         self._export_errors = 0
         
-        for archive_path in archives:
+        # Archives are exported from as the directory walk finds them
+        for archive_path in _find_archives(source, self._get_extensions(game_format)):
             if self._cancelled:
                 return False
             
             extractor = self._get_extractor(game_format, archive_path)
             if not extractor:
                 continue
+            extractor.create_output_dirs = False  # parents come from _ensure_parent_dir
             
             try:
                 if extractor.open(archive_path):
-                    files = extractor.list_files()
-                    
-                    for j, entry in enumerate(files):
+                    for entry in extractor.iter_files():
                         if self._cancelled:
                             extractor.close()
                             return False
@@ -719,9 +1048,9 @@ class ExtractWorker(QThread):
                         if entry.path.lower() in custom_set:
                             # Build output path, sanitizing for Windows
                             safe_path = self._sanitize_path(entry.path)
-                            out_path = os.path.join(output, safe_path)
+                            out_path = out_prefix + safe_path
                             
-                            if j % 50 == 0:
+                            if self._progress_due():
                                 self.progress.emit(
                                     self._export_count, 
                                     len(self._custom_files), 
@@ -729,6 +1058,7 @@ class ExtractWorker(QThread):
                                 )
                             
                             try:
+                                self._ensure_parent_dir(out_path)
                                 if extractor.extract_file(entry.path, out_path):
                                     self._export_count += 1
                                 else:
@@ -747,6 +1077,15 @@ class ExtractWorker(QThread):
         
         return True
     
+    def _ensure_parent_dir(self, out_path: str):
+        """Create out_path's parent directory, once per directory per run."""
+        parent = os.path.dirname(out_path)
+        if parent not in self._dirs_created:
+            os.makedirs(parent, exist_ok=True)
+            self._dirs_created.add(parent)
+    
+    _SANITIZE_TABLE = str.maketrans({'\\': os.sep, **{c: '_' for c in '<>:"|?*'}})
+    
     def _sanitize_path(self, path: str) -> str:
         """
         Sanitize a file path for Windows filesystem.
@@ -760,18 +1099,13 @@ class ExtractWorker(QThread):
         Returns:
             Sanitized path safe for Windows
         """
-        # Replace backslashes with OS separator
-        path = path.replace('\\', os.sep)
+        # Backslashes -> OS separator and invalid Windows filename characters
+        # (<>:"|?*) -> underscore, in one C-level pass
+        path = path.translate(self._SANITIZE_TABLE)
         
-        # Characters invalid in Windows filenames
-        invalid_chars = '<>:"|?*'
-        
-        # Replace invalid characters with underscore
-        for char in invalid_chars:
-            path = path.replace(char, '_')
-        
-        # Remove control characters and non-printable chars
-        path = ''.join(c if c.isprintable() and ord(c) < 128 else '_' for c in path)
+        # Remove control characters and non-printable chars (per-char pass only if any exist)
+        if not (path.isascii() and path.isprintable()):
+            path = ''.join(c if c.isprintable() and ord(c) < 128 else '_' for c in path)
         
         # Remove leading/trailing spaces and dots from path components
         parts = path.split(os.sep)
@@ -826,19 +1160,14 @@ class ExtractWorker(QThread):
         self.log.emit(f"Output to: {output}")
         
         # Find archives
-        archives = []
-        extensions = self._get_extensions(game_format)
-        
-        for root, dirs, files in os.walk(source):
-            for f in files:
-                if any(f.lower().endswith(ext) for ext in extensions):
-                    archives.append(os.path.join(root, f))
+        archives = list(_find_archives(source, self._get_extensions(game_format)))
         
         if not archives:
             self.error.emit(f"No archives found in {source}")
             return
         
         self.log.emit(f"Found {len(archives)} archive(s)")
+        out_prefix = os.path.join(output, '')  # joined once; sanitized paths are always relative
         
         total_extracted = 0
         total_errors = 0
@@ -853,25 +1182,27 @@ class ExtractWorker(QThread):
             extractor = self._get_extractor(game_format, archive_path)
             if not extractor:
                 continue
+            extractor.create_output_dirs = False  # parents come from _ensure_parent_dir
             
             try:
                 if extractor.open(archive_path):
-                    files = extractor.list_files()
-                    self.log.emit(f"  {len(files)} files")
+                    file_count = extractor.get_file_count()
+                    self.log.emit(f"  {file_count} files")
                     
-                    for j, entry in enumerate(files):
+                    for j, entry in enumerate(extractor.iter_files()):
                         if self._cancelled:
                             extractor.close()
                             break
                         
-                        if j % 100 == 0:
-                            self.progress.emit(j, len(files), entry.path[:60])
+                        if self._progress_due():
+                            self.progress.emit(j, file_count, entry.path[:60])
                         
                         # Sanitize path for Windows
                         safe_path = self._sanitize_path(entry.path)
-                        out_path = os.path.join(output, safe_path)
+                        out_path = out_prefix + safe_path
                         
                         try:
+                            self._ensure_parent_dir(out_path)
                             if extractor.extract_file(entry.path, out_path):
                                 total_extracted += 1
                             else:
@@ -969,33 +1300,133 @@ class ExtractWorker(QThread):
             'cancelled': self._cancelled
         })
     
-    def _get_extensions(self, game_format: str) -> list:
-        """Get file extensions for a format."""
-        ext_map = {
-            'grf': ['.grf', '.gpf'],
-            'vfs': ['.vfs'],
-            'pak': ['.pak'],
-            'pkg': ['.pkg'],
-            'dat': ['.dat', '.u'],
-            'other': ['*']
-        }
-        return ext_map.get(game_format, ['*'])
+    def _get_extensions(self, game_format: str) -> Tuple[str, ...]:
+        """Get the (lowercase) archive extensions for a format."""
+        return _ARCHIVE_EXTENSIONS.get(game_format, _ARCHIVE_EXTENSIONS['other'])
     
     def _get_extractor(self, game_format: str, archive_path: str):
         """Get appropriate extractor for format."""
-        try:
-            if game_format == 'grf':
-                from src.extractors.grf_extractor import GRFExtractor
-                return GRFExtractor()
-            elif game_format == 'vfs':
-                from src.extractors.vfs_extractor import VFSExtractor
-                return VFSExtractor()
-            else:
-                from src.extractors.generic_extractor import GenericExtractor
-                return GenericExtractor()
-        except ImportError as e:
-            self.log.emit(f"[WARN] Extractor not available: {e}")
+        cls = _get_extractor_class(game_format)
+        if cls is None:
+            self.log.emit(f"[WARN] Extractor not available for format: {game_format}")
             return None
+        return cls()
+
+
+# ==============================================================================
+# STYLESHEET
+# ==============================================================================
+# Dark theme, set once on the QApplication so every window and dialog inherits
+# it from a single parse instead of each window re-parsing its own copy
+_STYLESHEET = """
+QMainWindow { background-color: #1a1a2e; }
+QTabWidget::pane { border: 1px solid #3d3d5c; background-color: #16213e; border-radius: 4px; }
+QTabBar::tab { background-color: #0f3460; color: #e0e0e0; padding: 10px 20px; margin-right: 2px; border-top-left-radius: 4px; border-top-right-radius: 4px; }
+QTabBar::tab:selected { background-color: #1a1a2e; color: #ffffff; }
+QTabBar::tab:hover { background-color: #1f4068; }
+QGroupBox { font-weight: bold; border: 1px solid #3d3d5c; border-radius: 4px; margin-top: 10px; padding-top: 10px; color: #e0e0e0; }
+QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
+QPushButton { background-color: #0f3460; color: #ffffff; border: none; padding: 8px 16px; border-radius: 4px; font-weight: bold; }
+QPushButton:hover { background-color: #1f4068; }
+QPushButton:pressed { background-color: #0a2540; }
+QPushButton:disabled { background-color: #2d2d4d; color: #666666; }
+QPushButton#greenBtn { background-color: #1b5e20; }
+QPushButton#greenBtn:hover { background-color: #2e7d32; }
+QPushButton#orangeBtn { background-color: #e65100; }
+QPushButton#orangeBtn:hover { background-color: #ff6d00; }
+QLineEdit, QComboBox, QTextEdit, QSpinBox { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; padding: 6px; border-radius: 4px; }
+QLineEdit:focus, QComboBox:focus { border-color: #0f3460; }
+QTableWidget { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; gridline-color: #3d3d5c; }
+QTableWidget::item:selected { background-color: #0f3460; }
+QHeaderView::section { background-color: #0f3460; color: #ffffff; padding: 8px; border: none; }
+QProgressBar { border: 1px solid #3d3d5c; border-radius: 4px; text-align: center; color: #ffffff; background-color: #16213e; }
+QProgressBar::chunk { background-color: #4caf50; border-radius: 3px; }
+QLabel { color: #e0e0e0; }
+QTreeWidget { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; }
+QTreeWidget::item:selected { background-color: #0f3460; }
+QStatusBar { background-color: #0f3460; color: #e0e0e0; }
+QListView { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; }
+QDialog { background-color: #1a1a2e; }
+"""
+
+
+def apply_app_stylesheet(app: "QApplication"):
+    """
+    Set the dark theme on the application.
+    
+    Call before the first widget is created: widgets then pick the style up
+    once when they are first polished instead of being restyled when a
+    window-level stylesheet is set over an already built tree.
+    """
+    if app.styleSheet() != _STYLESHEET:
+        app.setStyleSheet(_STYLESHEET)
+
+
+# ==============================================================================
+# PATH LIST MODEL
+# ==============================================================================
+class PathListModel(LazyListModel):
+    """
+    Flat list of path strings for the results lists.
+    
+    Rows are exposed in batches (see LazyListModel), so a comparison with
+    hundreds of thousands of new files fills the view in constant time and
+    only rows the user scrolls to are materialized.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._shared = False  # _rows is the caller's list; copy before editing it
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._row(index)
+    
+    def set_paths(self, paths: List[str]):
+        """Replace the contents (the list is kept, not copied, until first edited)."""
+        self.beginResetModel()
+        self._assign_rows(paths)
+        self._shared = True
+        self.endResetModel()
+    
+    def _own_paths(self):
+        if self._shared:
+            self._rows = list(self._rows)
+            self._shared = False
+    
+    def insert_sorted(self, paths: List[str]):
+        """
+        Insert `paths` into the (sorted) contents, keeping it sorted.
+        
+        Only rows already fetched by the view are announced with row
+        insertions; the rest are picked up by fetchMore().
+        """
+        self._own_paths()
+        for path in paths:
+            row = bisect.bisect_left(self._rows, path)
+            if row < self._loaded:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._rows.insert(row, path)
+                self._loaded += 1
+                self.endInsertRows()
+            else:
+                self._rows.insert(row, path)
+    
+    def remove_sorted(self, path: str) -> bool:
+        """Remove `path` from the (sorted) contents; False if it is not listed."""
+        row = bisect.bisect_left(self._rows, path)
+        if row >= len(self._rows) or self._rows[row] != path:
+            return False
+        self._own_paths()
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            del self._rows[row]
+        return True
 
 
 # ==============================================================================
@@ -1014,6 +1445,14 @@ class MainWindow(QMainWindow):
     - Exporting only custom/modified files
     """
     
+    # Log view batching: flush interval, queued-line cap and lines kept in the view
+    LOG_FLUSH_MS = 100
+    LOG_QUEUE_MAX = 10_000
+    LOG_MAX_LINES = 5_000
+    
+    # Most paths added to the GRF contents list in place; larger adds re-list it
+    GRF_LIST_INSERT_MAX = 1_000
+    
     def __init__(self):
         super().__init__()
         
@@ -1021,10 +1460,23 @@ class MainWindow(QMainWindow):
         self.db = None
         self.games = []          # List of (id, name, format, vanilla_path)
         self.servers = []        # List of server dicts
-        self.baseline = {}       # {path: {hash, size, archive}}
+        self.baseline = {}       # Baseline {path: (digest, size, archive_idx)}
         self.comparison = None   # Last comparison results
         self.worker = None       # Background worker thread
         
+        # Heavy tabs, built on first activation (None until then)
+        self.grf_browser = None
+        self.act_spr_editor = None
+        self.character_designer = None
+        self._tab_factories = {}  # placeholder widget -> callable building the real tab
+        
+        # Log lines are queued and written to the log view in batches (see _log)
+        self._log_queue = collections.deque(maxlen=self.LOG_QUEUE_MAX)
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Initialize
         self._init_database()
         self._setup_window()
@@ -1048,6 +1500,12 @@ class MainWindow(QMainWindow):
                 )
             
             os.makedirs(data_dir, exist_ok=True)
+            
+            # Decoded GRF file tables are cached next to the database between runs
+            grf_class = _get_extractor_class('grf')
+            if grf_class is not None:
+                grf_class.table_cache_dir = os.path.join(data_dir, 'grf_tables')
+            
             db_path = os.path.join(data_dir, 'harvester.db')
             self.db = Database(db_path)
             print(f"[INFO] Database: {db_path}")
@@ -1065,37 +1523,11 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
         self.resize(1400, 900)
         
-        # Dark theme stylesheet
-        self.setStyleSheet("""
-            QMainWindow { background-color: #1a1a2e; }
-            QTabWidget::pane { border: 1px solid #3d3d5c; background-color: #16213e; border-radius: 4px; }
-            QTabBar::tab { background-color: #0f3460; color: #e0e0e0; padding: 10px 20px; margin-right: 2px; border-top-left-radius: 4px; border-top-right-radius: 4px; }
-            QTabBar::tab:selected { background-color: #1a1a2e; color: #ffffff; }
-            QTabBar::tab:hover { background-color: #1f4068; }
-            QGroupBox { font-weight: bold; border: 1px solid #3d3d5c; border-radius: 4px; margin-top: 10px; padding-top: 10px; color: #e0e0e0; }
-            QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }
-            QPushButton { background-color: #0f3460; color: #ffffff; border: none; padding: 8px 16px; border-radius: 4px; font-weight: bold; }
-            QPushButton:hover { background-color: #1f4068; }
-            QPushButton:pressed { background-color: #0a2540; }
-            QPushButton:disabled { background-color: #2d2d4d; color: #666666; }
-            QPushButton#greenBtn { background-color: #1b5e20; }
-            QPushButton#greenBtn:hover { background-color: #2e7d32; }
-            QPushButton#orangeBtn { background-color: #e65100; }
-            QPushButton#orangeBtn:hover { background-color: #ff6d00; }
-            QLineEdit, QComboBox, QTextEdit, QSpinBox { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; padding: 6px; border-radius: 4px; }
-            QLineEdit:focus, QComboBox:focus { border-color: #0f3460; }
-            QTableWidget { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; gridline-color: #3d3d5c; }
-            QTableWidget::item:selected { background-color: #0f3460; }
-            QHeaderView::section { background-color: #0f3460; color: #ffffff; padding: 8px; border: none; }
-            QProgressBar { border: 1px solid #3d3d5c; border-radius: 4px; text-align: center; color: #ffffff; background-color: #16213e; }
-            QProgressBar::chunk { background-color: #4caf50; border-radius: 3px; }
-            QLabel { color: #e0e0e0; }
-            QTreeWidget { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; }
-            QTreeWidget::item:selected { background-color: #0f3460; }
-            QStatusBar { background-color: #0f3460; color: #e0e0e0; }
-            QListWidget { background-color: #16213e; color: #e0e0e0; border: 1px solid #3d3d5c; }
-            QDialog { background-color: #1a1a2e; }
-        """)
+        # Dark theme: normally applied by the entry point before any widget
+        # exists (apply_app_stylesheet); set here only if it was not
+        app = QApplication.instance()
+        if app is not None and not app.styleSheet():
+            apply_app_stylesheet(app)
     
     def _setup_toolbar(self):
         """Create toolbar."""
@@ -1145,6 +1577,7 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(10, 10, 10, 10)
         
         self.tabs = QTabWidget()
+        self.tabs.currentChanged.connect(self._materialize_tab)
         layout.addWidget(self.tabs)
         
         self._create_extract_tab()    # Main functionality first
@@ -1210,7 +1643,7 @@ class MainWindow(QMainWindow):
         self.vanilla_path.setPlaceholderText("Path to official/vanilla game client folder...")
         vanilla_row.addWidget(self.vanilla_path)
         browse_vanilla = QPushButton("Browse...")
-        browse_vanilla.clicked.connect(lambda: self._browse_path(self.vanilla_path))
+        browse_vanilla.clicked.connect(lambda: self._browse_path(self.vanilla_path, 'vanilla'))
         vanilla_row.addWidget(browse_vanilla)
         
         self.scan_baseline_btn = QPushButton("📁 Scan Vanilla Baseline")
@@ -1231,7 +1664,7 @@ class MainWindow(QMainWindow):
         self.server_path.setPlaceholderText("Path to private server client folder...")
         server_row.addWidget(self.server_path)
         browse_server = QPushButton("Browse...")
-        browse_server.clicked.connect(lambda: self._browse_path(self.server_path))
+        browse_server.clicked.connect(lambda: self._browse_path(self.server_path, 'server'))
         server_row.addWidget(browse_server)
         step3_layout.addLayout(server_row)
         
@@ -1246,7 +1679,7 @@ class MainWindow(QMainWindow):
         self.output_path.setPlaceholderText("Where to save extracted assets...")
         step4_layout.addWidget(self.output_path)
         browse_output = QPushButton("Browse...")
-        browse_output.clicked.connect(lambda: self._browse_path(self.output_path))
+        browse_output.clicked.connect(lambda: self._browse_path(self.output_path, 'output'))
         step4_layout.addWidget(browse_output)
         
         layout.addWidget(step4)
@@ -1330,6 +1763,8 @@ class MainWindow(QMainWindow):
         self.log_text.setReadOnly(True)
         self.log_text.setFont(QFont("Consolas", 9))
         self.log_text.setMinimumHeight(200)
+        # Bound the document so appends don't slow down as the log grows
+        self.log_text.document().setMaximumBlockCount(self.LOG_MAX_LINES)
         log_layout.addWidget(self.log_text)
         
         clear_log = QPushButton("Clear Log")
@@ -1425,16 +1860,32 @@ class MainWindow(QMainWindow):
         lists_layout = QHBoxLayout()
         
         # Modified files
+        # Rows are laid out in batches and never measured for width; long
+        # paths are elided in the middle so the file name stays visible.
         modified_group = QGroupBox("Modified Files (changed from vanilla)")
         modified_layout = QVBoxLayout(modified_group)
-        self.modified_list = QListWidget()
+        self.modified_list = QListView()
+        self.modified_list.setUniformItemSizes(True)
+        self.modified_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.modified_list.setBatchSize(100)
+        self.modified_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.modified_list.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+        self.modified_list_model = PathListModel(self.modified_list)
+        self.modified_list.setModel(self.modified_list_model)
         modified_layout.addWidget(self.modified_list)
         lists_layout.addWidget(modified_group)
         
         # New files
         new_group = QGroupBox("New Files (custom content)")
         new_layout = QVBoxLayout(new_group)
-        self.new_list = QListWidget()
+        self.new_list = QListView()
+        self.new_list.setUniformItemSizes(True)
+        self.new_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.new_list.setBatchSize(100)
+        self.new_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.new_list.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+        self.new_list_model = PathListModel(self.new_list)
+        self.new_list.setModel(self.new_list_model)
         new_layout.addWidget(self.new_list)
         lists_layout.addWidget(new_group)
         
@@ -1442,14 +1893,61 @@ class MainWindow(QMainWindow):
         
         self.tabs.addTab(tab, "📊 Results")
     
+    def _add_lazy_tab(self, title: str, factory):
+        """
+        Add a tab whose real widget is only built the first time it is shown.
+        
+        An empty placeholder holds the tab's place; `factory` is called by
+        _materialize_tab() and must return the widget to put in its place.
+        """
+        placeholder = QWidget()
+        self._tab_factories[placeholder] = factory
+        self.tabs.addTab(placeholder, title)
+    
+    def _materialize_tab(self, index: int):
+        """Swap a lazy tab's placeholder for its real widget on first activation."""
+        placeholder = self.tabs.widget(index)
+        factory = self._tab_factories.pop(placeholder, None)
+        if factory is None:
+            return
+        
+        title = self.tabs.tabText(index)
+        widget = factory()
+        
+        # Swapping pages would re-emit currentChanged; the factory is already consumed
+        self.tabs.blockSignals(True)
+        try:
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def _unavailable_tab(self, message: str) -> QWidget:
+        """Placeholder page explaining why an optional tab could not be loaded."""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        
+        info_label = QLabel(message)
+        info_label.setTextFormat(Qt.TextFormat.RichText)
+        info_label.setWordWrap(True)
+        info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(info_label)
+        layout.addStretch()
+        return tab
+    
     def _create_grf_browser_tab(self):
-        """Create GRF Browser tab for browsing GRF contents."""
-        if not GRF_BROWSER_AVAILABLE:
-            # Create placeholder tab
-            tab = QWidget()
-            layout = QVBoxLayout(tab)
-            
-            info_label = QLabel(
+        """Create GRF Browser tab for browsing GRF contents (built on first use)."""
+        self._add_lazy_tab("📂 GRF Browser", self._build_grf_browser)
+    
+    def _build_grf_browser(self) -> QWidget:
+        """Import and build the GRF Browser widget."""
+        try:
+            from src.gui.grf_browser import GRFBrowserWidget
+        except ImportError:
+            print("[INFO] GRF Browser module not loaded - this is optional")
+            return self._unavailable_tab(
                 "<h2>📂 GRF Browser</h2>"
                 "<p>The GRF Browser module could not be loaded.</p>"
                 "<p>Make sure the following files exist:</p>"
@@ -1458,14 +1956,6 @@ class MainWindow(QMainWindow):
                 "<li>src/extractors/grf_vfs.py</li>"
                 "</ul>"
             )
-            info_label.setTextFormat(Qt.TextFormat.RichText)
-            info_label.setWordWrap(True)
-            info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(info_label)
-            layout.addStretch()
-            
-            self.tabs.addTab(tab, "📂 GRF Browser")
-            return
         
         # Create the GRF Browser widget
         self.grf_browser = GRFBrowserWidget()
@@ -1473,8 +1963,8 @@ class MainWindow(QMainWindow):
         # Connect signals for integration
         self.grf_browser.file_selected.connect(self._on_grf_browser_file_selected)
         
-        self.tabs.addTab(self.grf_browser, "📂 GRF Browser")
         self._log("GRF Browser loaded - Browse GRF archives without extraction")
+        return self.grf_browser
     
     def _on_grf_browser_file_selected(self, file_path: str):
         """
@@ -1493,15 +1983,17 @@ class MainWindow(QMainWindow):
         
         This tab provides direct editing of Ragnarok Online ACT (action) and 
         SPR (sprite) files. It's separate from the Character Designer which 
-        focuses on visual preview/composition.
+        focuses on visual preview/composition. Built on first use.
         """
-        # Check if the ACT/SPR Editor module is available
-        if not ACT_SPR_EDITOR_AVAILABLE:
-            # Create a placeholder tab
-            tab = QWidget()
-            layout = QVBoxLayout(tab)
-            
-            info_label = QLabel(
+        self._add_lazy_tab("✏️ ACT/SPR Editor", self._build_act_spr_editor)
+    
+    def _build_act_spr_editor(self) -> QWidget:
+        """Import and build the ACT/SPR Editor widget."""
+        try:
+            from src.gui.act_spr_editor import ACTSPREditorWidget
+        except ImportError:
+            print("[INFO] ACT/SPR Editor module not loaded - this is optional")
+            return self._unavailable_tab(
                 "<h2>✏️ ACT/SPR Editor</h2>"
                 "<p>The ACT/SPR Editor module could not be loaded.</p>"
                 "<p>Make sure the following files exist:</p>"
@@ -1511,19 +2003,11 @@ class MainWindow(QMainWindow):
                 "<li>src/parsers/spr_parser.py</li>"
                 "</ul>"
             )
-            info_label.setTextFormat(Qt.TextFormat.RichText)
-            info_label.setWordWrap(True)
-            info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(info_label)
-            layout.addStretch()
-            
-            self.tabs.addTab(tab, "✏️ ACT/SPR Editor")
-            return
         
         # Create the ACT/SPR Editor widget
         self.act_spr_editor = ACTSPREditorWidget()
-        self.tabs.addTab(self.act_spr_editor, "✏️ ACT/SPR Editor")
         self._log("ACT/SPR Editor loaded - Use this for binary editing of ACT/SPR files")
+        return self.act_spr_editor
     
     def _create_character_designer_tab(self):
         """
@@ -1543,16 +2027,18 @@ class MainWindow(QMainWindow):
         
         The Character Designer requires extracted RO data files (from GRF) to
         function. Point it to a folder containing the extracted 'data/sprite'
-        directory structure.
+        directory structure. The widget is built the first time the tab is shown.
         """
-        # Check if the Character Designer module is available
-        if not CHARACTER_DESIGNER_AVAILABLE:
-            # Create a placeholder tab explaining the feature is not available
-            tab = QWidget()
-            layout = QVBoxLayout(tab)
-            
-            # Info message
-            info_label = QLabel(
+        self._add_lazy_tab("🎨 Character Designer", self._build_character_designer)
+    
+    def _build_character_designer(self) -> QWidget:
+        """Import and build the Character Designer widget."""
+        try:
+            from src.gui.character_designer import CharacterDesignerWidget
+        except ImportError:
+            print("[INFO] Character Designer module not loaded - this is optional")
+            # Placeholder explaining the feature is not available
+            return self._unavailable_tab(
                 "<h2>🎨 RO Character Designer</h2>"
                 "<p>The Character Designer module could not be loaded.</p>"
                 "<p>Make sure the following files exist:</p>"
@@ -1564,14 +2050,6 @@ class MainWindow(QMainWindow):
                 "<p>Also ensure PIL/Pillow is installed:</p>"
                 "<pre>pip install Pillow</pre>"
             )
-            info_label.setTextFormat(Qt.TextFormat.RichText)
-            info_label.setWordWrap(True)
-            info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(info_label)
-            
-            layout.addStretch()
-            self.tabs.addTab(tab, "🎨 Character Designer")
-            return
         
         # Create the Character Designer widget
         self.character_designer = CharacterDesignerWidget()
@@ -1582,15 +2060,14 @@ class MainWindow(QMainWindow):
         # Connect Character Designer to main window's database and baseline
         if self.character_designer.custom_detector:
             self.character_designer.custom_detector.database = self.db
-            # Update baseline if we have one
+            # Update baseline if we have one ({path: (digest, size, archive_idx)} -> {path: hex hash})
             if self.baseline:
-                self.character_designer.custom_detector.set_baseline(self.baseline)
-        
-        # Add to tabs
-        self.tabs.addTab(self.character_designer, "🎨 Character Designer")
+                self.character_designer.custom_detector.set_baseline(
+                    {path: entry[0].hex() for path, entry in self.baseline.items()})
         
         # Log that it's ready
         self._log("Character Designer loaded - Set resource path to extracted RO data")
+        return self.character_designer
     
     def _on_designer_sprite_loaded(self, path: str):
         """
@@ -1657,7 +2134,15 @@ class MainWindow(QMainWindow):
         contents_group = QGroupBox("GRF Contents")
         contents_layout = QVBoxLayout(contents_group)
 
-        self.grf_contents_list = QListWidget()
+        self.grf_contents_list = QListView()
+        self.grf_contents_list.setUniformItemSizes(True)
+        # Lay rows out in batches so a large archive never stalls one paint
+        self.grf_contents_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.grf_contents_list.setBatchSize(256)
+        self.grf_contents_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.grf_contents_list.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+        self.grf_contents_model = PathListModel(self.grf_contents_list)
+        self.grf_contents_list.setModel(self.grf_contents_model)
         contents_layout.addWidget(self.grf_contents_list)
 
         content_buttons = QHBoxLayout()
@@ -1756,15 +2241,17 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.grf_editor_status)
 
         self.tabs.addTab(tab, "📦 GRF Editor")
+        self.grf_editor_tab = tab
 
         # Store GRF editor instance
         self.grf_editor = None
 
     def _browse_grf_editor_file(self):
         """Browse for GRF file."""
-        path, _ = QFileDialog.getSaveFileName(self, "Select GRF File", "", "GRF Files (*.grf)")
+        path, _ = QFileDialog.getSaveFileName(self, "Select GRF File", self._recent_dir('grf'), "GRF Files (*.grf)")
         if path:
             self.grf_editor_path.setText(path)
+            self._remember_dir('grf', os.path.dirname(path))
 
     def _create_new_grf(self):
         """Create a new empty GRF file."""
@@ -1807,29 +2294,42 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error", "Failed to open GRF")
 
     def _refresh_grf_contents(self):
-        """Refresh the GRF contents list."""
-        self.grf_contents_list.clear()
-
+        """Refresh the GRF contents list (one model reset, no per-row items)."""
         if not self.grf_editor:
+            self.grf_contents_model.set_paths([])
             return
 
-        files = self.grf_editor.list_files()
-        for file_path in sorted(files):
-            self.grf_contents_list.addItem(file_path)
+        # Sorted once per change by the editor, reused on later refreshes
+        files = self.grf_editor.sorted_files()
+        self.grf_contents_model.set_paths(files)
 
         self.grf_editor_status.setText(f"{len(files)} files in GRF")
 
+    def _append_to_grf_list(self, paths: List[str]):
+        """Show newly added GRF paths without re-listing the whole archive."""
+        self.grf_contents_model.insert_sorted(paths)
+        self.grf_editor_status.setText(f"{len(self.grf_editor.files)} files in GRF")
+
+    def _remove_from_grf_list(self, path: str):
+        """Drop a removed GRF path from the list without re-listing the whole archive."""
+        if not self.grf_contents_model.remove_sorted(path):
+            self._refresh_grf_contents()
+            return
+        self.grf_editor_status.setText(f"{len(self.grf_editor.files)} files in GRF")
+
     def _browse_local_file(self):
         """Browse for local file to add."""
-        path, _ = QFileDialog.getOpenFileName(self, "Select File to Add")
+        path, _ = QFileDialog.getOpenFileName(self, "Select File to Add", self._recent_dir('grf_add'))
         if path:
             self.add_local_file_path.setText(path)
+            self._remember_dir('grf_add', os.path.dirname(path))
 
     def _browse_local_directory(self):
         """Browse for local directory to add."""
-        path = QFileDialog.getExistingDirectory(self, "Select Directory to Add")
+        path = QFileDialog.getExistingDirectory(self, "Select Directory to Add", self._recent_dir('grf_add'))
         if path:
             self.add_local_dir_path.setText(path)
+            self._remember_dir('grf_add', path)
 
     def _add_single_file_to_grf(self):
         """Add a single file to the GRF."""
@@ -1844,8 +2344,13 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "Enter both local and GRF paths")
             return
 
+        replaced = grf_path.replace('/', '\\').lower() in self.grf_editor.files
         if self.grf_editor.add_file(local_path, grf_path):
-            self._refresh_grf_contents()
+            if replaced:
+                # Same entry, possibly with new casing: re-list
+                self._refresh_grf_contents()
+            else:
+                self._append_to_grf_list([grf_path.replace('/', '\\')])
             self.grf_editor_status.setText("File added (not saved)")
             self.grf_editor_status.setStyleSheet("color: #ff9800; font-weight: bold;")
             self._log(f"Added: {grf_path}")
@@ -1866,10 +2371,21 @@ class MainWindow(QMainWindow):
             return
 
         recursive = self.grf_recursive_check.isChecked()
-        count = self.grf_editor.add_directory(local_dir, grf_base, recursive=recursive)
+        # Runs on the worker thread; see _on_grf_directory_added
+        self._start_grf_worker("add_grf_directory", editor=self.grf_editor,
+                               local_dir=local_dir, grf_base=grf_base, recursive=recursive)
 
+    def _on_grf_directory_added(self, result: dict):
+        """Update the editor tab once a background add-directory finishes."""
+        count = result.get('count', 0)
         if count > 0:
-            self._refresh_grf_contents()
+            added = result.get('added', [])
+            if result.get('replaced') or len(added) > self.GRF_LIST_INSERT_MAX:
+                # One re-sort beats thousands of single-row inserts, and a
+                # replaced entry may be listed under its old casing
+                self._refresh_grf_contents()
+            else:
+                self._append_to_grf_list(added)
             self.grf_editor_status.setText(f"Added {count} files (not saved)")
             self.grf_editor_status.setStyleSheet("color: #ff9800; font-weight: bold;")
             self._log(f"Added directory: {count} files")
@@ -1881,15 +2397,15 @@ class MainWindow(QMainWindow):
         if not self.grf_editor:
             return
 
-        selected = self.grf_contents_list.currentItem()
-        if not selected:
+        selected = self.grf_contents_list.currentIndex()
+        if not selected.isValid():
             QMessageBox.warning(self, "Error", "Select a file to remove")
             return
 
-        file_path = selected.text()
+        file_path = selected.data()
 
         if self.grf_editor.remove_file(file_path):
-            self._refresh_grf_contents()
+            self._remove_from_grf_list(file_path)
             self.grf_editor_status.setText("File removed (not saved)")
             self.grf_editor_status.setStyleSheet("color: #ff9800; font-weight: bold;")
             self._log(f"Removed: {file_path}")
@@ -1900,13 +2416,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "No GRF file open")
             return
 
-        self._log("Saving GRF...")
-        if self.grf_editor.save():
-            self.grf_editor_status.setText("GRF saved successfully")
-            self.grf_editor_status.setStyleSheet("color: #4caf50; font-weight: bold;")
-            QMessageBox.information(self, "Success", "GRF saved successfully")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to save GRF")
+        # Runs on the worker thread; see _on_grf_saved
+        self._start_grf_worker("save_grf", editor=self.grf_editor, path=None)
 
     def _save_grf_as(self):
         """Save the GRF to a new location."""
@@ -1914,23 +2425,36 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Error", "No GRF file open")
             return
 
-        path, _ = QFileDialog.getSaveFileName(self, "Save GRF As", "", "GRF Files (*.grf)")
+        path, _ = QFileDialog.getSaveFileName(self, "Save GRF As", self._recent_dir('grf'), "GRF Files (*.grf)")
         if path:
-            if self.grf_editor.save(path):
-                self.grf_editor_path.setText(path)
-                self.grf_editor_status.setText(f"GRF saved: {os.path.basename(path)}")
-                self.grf_editor_status.setStyleSheet("color: #4caf50; font-weight: bold;")
-                self._log(f"Saved GRF as: {path}")
-                QMessageBox.information(self, "Success", "GRF saved successfully")
-            else:
-                QMessageBox.critical(self, "Error", "Failed to save GRF")
+            self._remember_dir('grf', os.path.dirname(path))
+            self._start_grf_worker("save_grf", editor=self.grf_editor, path=path)
+
+    def _on_grf_saved(self, result: dict):
+        """Update the editor tab once a background save finishes."""
+        path = result.get('path', '')
+        if result.get('saved_as'):
+            self.grf_editor_path.setText(path)
+            self.grf_editor_status.setText(f"GRF saved: {os.path.basename(path)}")
+            self._log(f"Saved GRF as: {path}")
+        else:
+            self.grf_editor_status.setText("GRF saved successfully")
+        self.grf_editor_status.setStyleSheet("color: #4caf50; font-weight: bold;")
+        QMessageBox.information(self, "Success", "GRF saved successfully")
+
+    def _start_grf_worker(self, operation: str, **kwargs):
+        """Run a GRF editor operation on the worker, with the editor tab locked meanwhile."""
+        self._start_worker(operation, **kwargs)
+        if self.worker and self.worker.operation == operation and self.worker.isRunning():
+            # The editor is being changed off-thread: keep its controls out of reach
+            self.grf_editor_tab.setEnabled(False)
 
     def _close_grf_editor(self):
         """Close the current GRF file."""
         if self.grf_editor:
             self.grf_editor.close()
             self.grf_editor = None
-            self.grf_contents_list.clear()
+            self.grf_contents_model.set_paths([])
             self.grf_editor_status.setText("GRF closed")
             self.grf_editor_status.setStyleSheet("color: #888; font-style: italic;")
             self._log("GRF editor closed")
@@ -2000,12 +2524,10 @@ class MainWindow(QMainWindow):
             self.game_combo.addItem(f"{name} ({fmt.upper()})", gid)
         
         # Populate table
-        self.games_table.setRowCount(len(self.games))
-        for i, (gid, name, fmt, vpath) in enumerate(self.games):
-            self.games_table.setItem(i, 0, QTableWidgetItem(name))
-            self.games_table.setItem(i, 1, QTableWidgetItem(fmt.upper()))
-            self.games_table.setItem(i, 2, QTableWidgetItem(vpath or "Not set"))
-            self.games_table.setItem(i, 3, QTableWidgetItem("❌ Not scanned"))
+        self._fill_table(self.games_table, [
+            (name, fmt.upper(), vpath or "Not set", "❌ Not scanned")
+            for gid, name, fmt, vpath in self.games
+        ])
     
     def _load_servers(self):
         """Load servers list."""
@@ -2014,9 +2536,10 @@ class MainWindow(QMainWindow):
 
         if self.db:
             try:
+                # Game names from self.games (see _load_games) instead of one query per server
+                game_names = {gid: name for gid, name, _, _ in self.games}
                 db_servers = self.db.get_all_servers()
                 for s in db_servers:
-                    game = self.db.get_game(s.game_id)
                     # Get client path from latest client if exists
                     client_path = ""
                     if s.clients:
@@ -2024,7 +2547,7 @@ class MainWindow(QMainWindow):
                     self.servers.append({
                         'id': s.id,
                         'name': s.name,
-                        'game': game.name if game else "Unknown",
+                        'game': game_names.get(s.game_id, "Unknown"),
                         'game_id': s.game_id,
                         'path': client_path,
                         'website': s.website or ""
@@ -2032,22 +2555,58 @@ class MainWindow(QMainWindow):
             except:
                 pass
 
-        self.servers_table.setRowCount(len(self.servers))
-        for i, s in enumerate(self.servers):
-            self.servers_table.setItem(i, 0, QTableWidgetItem(s['name']))
-            self.servers_table.setItem(i, 1, QTableWidgetItem(s['game']))
-            self.servers_table.setItem(i, 2, QTableWidgetItem(s['path']))
-            self.servers_table.setItem(i, 3, QTableWidgetItem(s['website']))
+        self._fill_table(self.servers_table, [
+            (s['name'], s['game'], s['path'], s['website'])
+            for s in self.servers
+        ])
+    
+    @staticmethod
+    def _fill_table(table: QTableWidget, rows: List[tuple]):
+        """
+        Replace a table's contents with `rows` (tuples of cell text).
+        
+        Repaints and sorting are suspended for the fill, so the table lays out
+        once at the end rather than after every setItem().
+        """
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        try:
+            table.setRowCount(0)
+            table.setRowCount(len(rows))
+            for i, row in enumerate(rows):
+                for col, text in enumerate(row):
+                    table.setItem(i, col, QTableWidgetItem(text))
+        finally:
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
     
     # ==========================================================================
     # EVENT HANDLERS
     # ==========================================================================
     
-    def _browse_path(self, line_edit: QLineEdit):
-        """Browse for a folder path."""
-        path = QFileDialog.getExistingDirectory(self, "Select Folder")
+    def _browse_path(self, line_edit: QLineEdit, key: str = 'folder'):
+        """Browse for a folder path, starting from the field's value or the last folder used."""
+        start = line_edit.text().strip() or self._recent_dir(key)
+        path = QFileDialog.getExistingDirectory(self, "Select Folder", start)
         if path:
             line_edit.setText(path)
+            self._remember_dir(key, path)
+    
+    def _recent_dir(self, key: str) -> str:
+        """Last directory used by the browse dialog `key` ('' if none)."""
+        from src.core.config import get_config
+        return get_config().get('recent_dirs', {}).get(key, '')
+    
+    def _remember_dir(self, key: str, directory: str):
+        """Store `directory` as the start directory for the browse dialog `key`."""
+        from src.core.config import get_config
+        config = get_config()
+        recent = config.get('recent_dirs', {})
+        if recent.get(key) != directory:
+            recent[key] = directory
+            config.set('recent_dirs', recent)
+            config.save()
     
     def _on_game_changed(self):
         """Handle game selection change."""
@@ -2396,10 +2955,20 @@ class MainWindow(QMainWindow):
         self._set_busy(True)
         self.worker.start()
     
+    def closeEvent(self, event):
+        """Stop a running worker before the window (and its QThread) goes away."""
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
+            # Workers check the flag per file, so this returns promptly
+            self.worker.wait()
+        super().closeEvent(event)
+    
     def _set_busy(self, busy: bool):
         """Set UI busy state."""
         self.progress_bar.setVisible(busy)
         self.cancel_btn.setVisible(busy)
+        if not busy:
+            self.grf_editor_tab.setEnabled(True)
         
         self.scan_baseline_btn.setEnabled(not busy)
         self.extract_all_btn.setEnabled(not busy)
@@ -2419,6 +2988,9 @@ class MainWindow(QMainWindow):
         if result and result.get('cancelled', False):
             self._log("\n⚠️ Operation cancelled by user")
             self._set_busy(False)
+            if result.get('type') == 'grf_add_directory' and result.get('count'):
+                # Files added before the cancel are still in the editor
+                self._on_grf_directory_added(result)
             return
         
         self._set_busy(False)
@@ -2440,9 +3012,9 @@ class MainWindow(QMainWindow):
                     self.games_table.setItem(row, 3, QTableWidgetItem(f"✅ {count} files"))
                 
                 # Update Character Designer
-                if hasattr(self, 'character_designer') and self.character_designer:
+                if self.character_designer:
                     if self.character_designer.custom_detector:
-                        baseline_hashes = {path: data.get('hash', '') for path, data in self.baseline.items()}
+                        baseline_hashes = {path: entry[0].hex() for path, entry in self.baseline.items()}
                         self.character_designer.custom_detector.set_baseline(baseline_hashes)
             
             # Update comparison results
@@ -2461,14 +3033,8 @@ class MainWindow(QMainWindow):
                 self.custom_total_label.setText(f"⭐ CUSTOM TOTAL: {custom}")
                 
                 # Populate lists
-                self.modified_list.clear()
-                self.new_list.clear()
-                
-                for f in results.get('modified', [])[:1000]:
-                    self.modified_list.addItem(f)
-                
-                for f in results.get('new', [])[:1000]:
-                    self.new_list.addItem(f)
+                self.modified_list_model.set_paths(results.get('modified', []))
+                self.new_list_model.set_paths(results.get('new', []))
             
             # Show completion message
             exported = result.get('exported', 0)
@@ -2510,8 +3076,8 @@ class MainWindow(QMainWindow):
             
             # Update Character Designer with new baseline
             if self.character_designer and self.character_designer.custom_detector:
-                # Convert baseline format: {path: {hash, size, archive}} -> {path: hash}
-                baseline_hashes = {path: data.get('hash', '') for path, data in self.baseline.items()}
+                # Convert baseline format: {path: (digest, size, archive_idx)} -> {path: hex hash}
+                baseline_hashes = {path: entry[0].hex() for path, entry in self.baseline.items()}
                 self.character_designer.custom_detector.set_baseline(baseline_hashes)
                 self._log("Character Designer: Baseline updated")
         
@@ -2531,15 +3097,9 @@ class MainWindow(QMainWindow):
             self.new_label.setText(f"New: {new}")
             self.custom_total_label.setText(f"⭐ CUSTOM TOTAL: {custom}")
             
-            # Populate lists
-            self.modified_list.clear()
-            self.new_list.clear()
-            
-            for f in results.get('modified', [])[:1000]:  # Limit for performance
-                self.modified_list.addItem(f)
-            
-            for f in results.get('new', [])[:1000]:
-                self.new_list.addItem(f)
+            # Populate lists (the models only materialize rows as they are scrolled to)
+            self.modified_list_model.set_paths(results.get('modified', []))
+            self.new_list_model.set_paths(results.get('new', []))
             
             # Switch to results tab
             self.tabs.setCurrentIndex(2)
@@ -2557,6 +3117,12 @@ class MainWindow(QMainWindow):
             exported = result.get('exported', 0)
             self._log(f"\n✅ Export complete! {exported} custom files exported")
             QMessageBox.information(self, "Complete", f"Exported {exported} custom files!")
+        
+        # ===== GRF EDITOR RESULTS =====
+        elif result_type == 'grf_save':
+            self._on_grf_saved(result)
+        elif result_type == 'grf_add_directory':
+            self._on_grf_directory_added(result)
 
     def _on_phase_complete(self, phase: str, results: dict):
         """
@@ -2595,10 +3161,27 @@ class MainWindow(QMainWindow):
     # ==========================================================================
     
     def _log(self, message: str):
-        """Add message to log."""
+        """
+        Add message to log.
+        
+        Messages are queued and flushed to the log view at most every
+        LOG_FLUSH_MS, so a burst of worker messages costs one append and
+        layout pass instead of one per line.
+        """
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
-        self.status_label.setText(message[:100])
+        self._log_queue.append(f"[{timestamp}] {message}")
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Write queued log messages to the log view in one append."""
+        if not self._log_queue:
+            return
+        last = self._log_queue[-1]
+        self.log_text.append("\n".join(self._log_queue))
+        self._log_queue.clear()
+        # Status bar shows the latest message (without its timestamp)
+        self.status_label.setText(last[11:111])
         
         # Auto-scroll
         scrollbar = self.log_text.verticalScrollBar()
@@ -2617,6 +3200,7 @@ def run_gui():
     app = QApplication(sys.argv)
     app.setApplicationName("Asset Harvester")
     app.setApplicationVersion("1.0.0")
+    apply_app_stylesheet(app)
     
     window = MainWindow()
     window.show()
@@ -0,0 +1,65 @@
+# ==============================================================================
+# SHARED LIST MODELS
+# ==============================================================================
+# Qt item models used by more than one GUI module.
+#
+# Components:
+#   - LazyListModel: Flat list model that exposes its rows in batches
+# ==============================================================================
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex
+
+
+class LazyListModel(QAbstractListModel):
+    """
+    Flat list model over a Python list, exposed to the view in batches.
+
+    Rows are made visible FETCH_BATCH at a time via canFetchMore/fetchMore,
+    so filling a view with hundreds of thousands of rows is constant time and
+    only rows the user scrolls to are materialized. Subclasses implement
+    data() on top of _row().
+    """
+    FETCH_BATCH = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list = []
+        self._loaded = 0  # rows currently exposed to the view
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def _row(self, index):
+        """The row item for a valid, already fetched index, else None."""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= self._loaded:
+            return None
+        return self._rows[row]
+
+    def _assign_rows(self, rows: list):
+        """
+        Replace the contents with `rows` (kept, not copied), first batch fetched.
+
+        Emits nothing: call between beginResetModel() and endResetModel().
+        """
+        self._rows = rows
+        self._loaded = min(self.FETCH_BATCH, len(rows))
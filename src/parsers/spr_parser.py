@@ -98,6 +98,8 @@ class SPRSprite:
     rgba_frames: List[SPRFrame] = field(default_factory=list)
     palette: bytes = b""
     filepath: str = ""
+    # (palette bytes, (256, 4) uint8 lookup table) - rebuilt when palette is replaced
+    _palette_lut: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
     
     def get_total_frames(self) -> int:
         """Get total number of frames (indexed + RGBA)."""
@@ -264,6 +266,31 @@ class SPRSprite:
         
         return Image.frombytes("RGBA", (width, height), bytes(pixels))
 
+    def _get_palette_lut(self, pal: bytes) -> 'np.ndarray':
+        """
+        Get the (256, 4) uint8 RGBA lookup table for a palette.
+        
+        Built once and reused until the sprite's palette object changes.
+        """
+        cached = self._palette_lut
+        if cached is not None and cached[0] is pal:
+            return cached[1]
+        
+        # Build RGBA palette array (256 colors × 4 channels)
+        pal_arr = np.frombuffer(pal[:1024], dtype=np.uint8).copy().reshape(256, 4)
+        
+        # Only force index 0 to be transparent, preserve other alpha values
+        # BUT if all alpha values are 0 (buggy palette), set them to 255
+        if np.all(pal_arr[:, 3] == 0):
+            # Buggy palette - all alpha is 0, fix it
+            pal_arr[:, 3] = 255
+        
+        # Always ensure index 0 is transparent
+        pal_arr[0, 3] = 0
+        
+        self._palette_lut = (pal, pal_arr)
+        return pal_arr
+
     def _render_indexed(self, frame: SPRFrame) -> Optional['Image.Image']:
         """
         Render indexed (palette-based) frame to PIL Image.
@@ -300,26 +327,13 @@ class SPRSprite:
         
         if NUMPY_AVAILABLE:
             try:
-                # Build RGBA palette array (256 colors × 4 channels)
-                pal_arr = np.frombuffer(pal[:1024], dtype=np.uint8).copy().reshape(256, 4)
-                
-                # Only force index 0 to be transparent, preserve other alpha values
-                # BUT if all alpha values are 0 (buggy palette), set them to 255
-                if np.all(pal_arr[:, 3] == 0):
-                    # Buggy palette - all alpha is 0, fix it
-                    pal_arr[:, 3] = 255
-                
-                # Always ensure index 0 is transparent
-                pal_arr[0, 3] = 0
-                
-                # Create pixel index array
-                idx = np.frombuffer(data, dtype=np.uint8).copy()
+                pal_arr = self._get_palette_lut(pal)
                 
-                # Lookup colors from palette
-                rgba = pal_arr[idx]
+                # Pixel indices as a (height, width) view over the frame bytes
+                idx = np.frombuffer(data, dtype=np.uint8).reshape((height, width))
                 
-                # Reshape to image dimensions
-                rgba = rgba.reshape((height, width, 4))
+                # Single LUT gather: (h, w) indices -> (h, w, 4) RGBA
+                rgba = np.take(pal_arr, idx, axis=0)
                 
                 return Image.fromarray(rgba, 'RGBA')
             except Exception as e: